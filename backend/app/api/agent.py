@@ -15,9 +15,16 @@ from app.api import approvals as approvals_api
 from app.api import board_memory as board_memory_api
 from app.api import board_onboarding as onboarding_api
 from app.api import tasks as tasks_api
-from app.api.deps import ActorContext, get_board_or_404, get_task_or_404
+from app.api.deps import (
+    ActorContext,
+    BoardLoader,
+    get_board_loader,
+    get_board_or_404,
+    get_task_or_404,
+)
 from app.core.agent_auth import AgentAuthContext, get_agent_auth_context
-from app.db.pagination import paginate
+from app.core.response_cache import cached_response, invalidate_board_responses
+from app.db.pagination import paginate, paginate_items
 from app.db.session import get_session
 from app.models.agents import Agent
 from app.models.boards import Board
@@ -73,6 +80,7 @@ router = APIRouter(prefix="/agent", tags=["agent"])
 SESSION_DEP = Depends(get_session)
 AGENT_CTX_DEP = Depends(get_agent_auth_context)
 BOARD_DEP = Depends(get_board_or_404)
+BOARD_LOADER_DEP = Depends(get_board_loader)
 TASK_DEP = Depends(get_task_or_404)
 BOARD_ID_QUERY = Query(default=None)
 TASK_STATUS_QUERY = Query(default=None, alias="status")
@@ -111,7 +119,7 @@ class AgentTaskListFilters(SQLModel):
     unassigned: bool | None = None
 
 
-def _task_list_filters(
+async def _task_list_filters(
     status_filter: str | None = TASK_STATUS_QUERY,
     assigned_agent_id: UUID | None = None,
     unassigned: bool | None = None,
@@ -167,9 +175,26 @@ def _agent_board_openapi_hints(
     }
 
 
-def _guard_board_access(agent_ctx: AgentAuthContext, board: Board) -> None:
-    allowed = not (agent_ctx.agent.board_id and agent_ctx.agent.board_id != board.id)
-    OpenClawAuthorizationPolicy.require_board_write_access(allowed=allowed)
+def _task_scope_ok(agent_board_id: UUID | None, task_board_id: UUID | None) -> bool:
+    """Return whether an agent scoped to `agent_board_id` may touch `task_board_id`.
+
+    Unscoped agents (and board-less targets) are never rejected here.
+    """
+    return not agent_board_id or not task_board_id or agent_board_id == task_board_id
+
+
+async def _guard_board_access(
+    board: Board = BOARD_DEP,
+    agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
+) -> Board:
+    """Resolve the path board and reject agents scoped to a different board."""
+    OpenClawAuthorizationPolicy.require_board_write_access(
+        allowed=_task_scope_ok(agent_ctx.agent.board_id, board.id),
+    )
+    return board
+
+
+BOARD_ACCESS_DEP = Depends(_guard_board_access)
 
 
 def _require_board_lead(agent_ctx: AgentAuthContext) -> Agent:
@@ -179,11 +204,18 @@ def _require_board_lead(agent_ctx: AgentAuthContext) -> Agent:
     )
 
 
-def _guard_task_access(agent_ctx: AgentAuthContext, task: Task) -> None:
-    allowed = not (
-        agent_ctx.agent.board_id and task.board_id and agent_ctx.agent.board_id != task.board_id
+async def _guard_task_access(
+    task: Task = TASK_DEP,
+    agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
+) -> Task:
+    """Resolve the path task and reject agents scoped to a different board."""
+    OpenClawAuthorizationPolicy.require_board_write_access(
+        allowed=_task_scope_ok(agent_ctx.agent.board_id, task.board_id),
     )
-    OpenClawAuthorizationPolicy.require_board_write_access(allowed=allowed)
+    return task
+
+
+TASK_ACCESS_DEP = Depends(_guard_task_access)
 
 
 @router.get(
@@ -239,7 +271,7 @@ def _guard_task_access(agent_ctx: AgentAuthContext, task: Task) -> None:
         ],
     },
 )
-def agent_healthz(
+async def agent_healthz(
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
 ) -> AgentHealthStatusResponse:
     """Return authenticated liveness metadata for the current agent token."""
@@ -306,19 +338,23 @@ def agent_healthz(
         ],
     },
 )
+@cached_response(policy="normal")
 async def list_boards(
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
+    board_loader: BoardLoader = BOARD_LOADER_DEP,
 ) -> LimitOffsetPage[BoardRead]:
     """List boards visible to the authenticated agent.
 
     Board-scoped agents typically see only their assigned board.
     Main agents may see multiple boards when permitted by auth scope.
     """
-    statement = select(Board)
     if agent_ctx.agent.board_id:
-        statement = statement.where(col(Board.id) == agent_ctx.agent.board_id)
-    statement = statement.order_by(col(Board.created_at).desc())
+        # Single-board agents skip the count + page queries entirely.
+        board = await board_loader.load(agent_ctx.agent.board_id)
+        items = [] if board is None else [BoardRead.model_validate(board, from_attributes=True)]
+        return paginate_items(items)
+    statement = select(Board).order_by(col(Board.created_at).desc())
     return await paginate(session, statement)
 
 
@@ -375,16 +411,14 @@ async def list_boards(
         ],
     },
 )
-def get_board(
-    board: Board = BOARD_DEP,
-    agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
+async def get_board(
+    board: Board = BOARD_ACCESS_DEP,
 ) -> Board:
     """Return one board if the authenticated agent can access it.
 
     Use this when an agent needs board metadata (objective, status, target date)
     before planning or posting updates.
     """
-    _guard_board_access(agent_ctx, board)
     return board
 
 
@@ -501,9 +535,10 @@ async def list_agents(
         ],
     ),
 )
+@cached_response(policy="short")
 async def list_tasks(
     filters: AgentTaskListFilters = TASK_LIST_FILTERS_DEP,
-    board: Board = BOARD_DEP,
+    board: Board = BOARD_ACCESS_DEP,
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
 ) -> LimitOffsetPage[TaskRead]:
@@ -513,7 +548,6 @@ async def list_tasks(
     - worker: fetch assigned inbox/in-progress tasks
     - lead: fetch unassigned inbox tasks for delegation
     """
-    _guard_board_access(agent_ctx, board)
     return await tasks_api.list_tasks(
         status_filter=filters.status_filter,
         assigned_agent_id=filters.assigned_agent_id,
@@ -545,15 +579,13 @@ async def list_tasks(
     ),
 )
 async def list_tags(
-    board: Board = BOARD_DEP,
+    board: Board = BOARD_ACCESS_DEP,
     session: AsyncSession = SESSION_DEP,
-    agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
 ) -> list[TagRef]:
     """List available tags for the board's organization.
 
     Use returned ids in task create/update payloads (`tag_ids`).
     """
-    _guard_board_access(agent_ctx, board)
     tags = (
         await session.exec(
             select(Tag)
@@ -649,7 +681,7 @@ async def list_tags(
 )
 async def create_task(
     payload: TaskCreate,
-    board: Board = BOARD_DEP,
+    board: Board = BOARD_ACCESS_DEP,
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
 ) -> TaskRead:
@@ -658,7 +690,6 @@ async def create_task(
     Lead-only endpoint. Supports dependency-aware creation via
     `depends_on_task_ids`, optional `tag_ids`, and `custom_field_values`.
     """
-    _guard_board_access(agent_ctx, board)
     _require_board_lead(agent_ctx)
     data = payload.model_dump(
         exclude={"depends_on_task_ids", "tag_ids", "custom_field_values"},
@@ -744,6 +775,7 @@ async def create_task(
         agent_id=agent_ctx.agent.id,
     )
     await session.commit()
+    await invalidate_board_responses(board.id)
     if task.assigned_agent_id:
         assigned_agent = await Agent.objects.by_id(task.assigned_agent_id).first(
             session,
@@ -792,7 +824,7 @@ async def create_task(
 )
 async def update_task(
     payload: TaskUpdate,
-    task: Task = TASK_DEP,
+    task: Task = TASK_ACCESS_DEP,
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
 ) -> TaskRead:
@@ -800,7 +832,6 @@ async def update_task(
 
     Supports status, assignment, dependencies, and optional inline comment.
     """
-    _guard_task_access(agent_ctx, task)
     return await tasks_api.update_task(
         payload=payload,
         task=task,
@@ -842,12 +873,11 @@ async def update_task(
     ),
 )
 async def delete_task(
-    task: Task = TASK_DEP,
+    task: Task = TASK_ACCESS_DEP,
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
 ) -> OkResponse:
     """Delete a task after board-lead authorization checks."""
-    _guard_task_access(agent_ctx, task)
     _require_board_lead(agent_ctx)
     if task.board_id is None:
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT)
@@ -875,8 +905,9 @@ async def delete_task(
         ],
     ),
 )
+@cached_response(policy="short")
 async def list_task_comments(
-    task: Task = TASK_DEP,
+    task: Task = TASK_ACCESS_DEP,
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
 ) -> LimitOffsetPage[TaskCommentRead]:
@@ -884,7 +915,6 @@ async def list_task_comments(
 
     Read this before posting updates to avoid duplicate or low-value comments.
     """
-    _guard_task_access(agent_ctx, task)
     return await tasks_api.list_task_comments(
         task=task,
         session=session,
@@ -913,7 +943,7 @@ async def list_task_comments(
 )
 async def create_task_comment(
     payload: TaskCommentCreate,
-    task: Task = TASK_DEP,
+    task: Task = TASK_ACCESS_DEP,
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
 ) -> ActivityEvent:
@@ -921,7 +951,6 @@ async def create_task_comment(
 
     This is the primary collaboration/log surface for task progress.
     """
-    _guard_task_access(agent_ctx, task)
     return await tasks_api.create_task_comment(
         payload=payload,
         task=task,
@@ -951,9 +980,10 @@ async def create_task_comment(
         ],
     ),
 )
+@cached_response(policy="short")
 async def list_board_memory(
     is_chat: bool | None = IS_CHAT_QUERY,
-    board: Board = BOARD_DEP,
+    board: Board = BOARD_ACCESS_DEP,
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
 ) -> LimitOffsetPage[BoardMemoryRead]:
@@ -961,7 +991,6 @@ async def list_board_memory(
 
     Use `is_chat=false` for durable context and `is_chat=true` for board chat.
     """
-    _guard_board_access(agent_ctx, board)
     return await board_memory_api.list_board_memory(
         is_chat=is_chat,
         board=board,
@@ -995,7 +1024,7 @@ async def list_board_memory(
 )
 async def create_board_memory(
     payload: BoardMemoryCreate,
-    board: Board = BOARD_DEP,
+    board: Board = BOARD_ACCESS_DEP,
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
 ) -> BoardMemory:
@@ -1003,7 +1032,6 @@ async def create_board_memory(
 
     Use tags to indicate purpose (e.g. `chat`, `decision`, `plan`, `handoff`).
     """
-    _guard_board_access(agent_ctx, board)
     return await board_memory_api.create_board_memory(
         payload=payload,
         board=board,
@@ -1033,9 +1061,10 @@ async def create_board_memory(
         ],
     ),
 )
+@cached_response(policy="short")
 async def list_approvals(
     status_filter: ApprovalStatus | None = APPROVAL_STATUS_QUERY,
-    board: Board = BOARD_DEP,
+    board: Board = BOARD_ACCESS_DEP,
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
 ) -> LimitOffsetPage[ApprovalRead]:
@@ -1043,7 +1072,6 @@ async def list_approvals(
 
     Use status filtering to process pending approvals efficiently.
     """
-    _guard_board_access(agent_ctx, board)
     return await approvals_api.list_approvals(
         status_filter=status_filter,
         board=board,
@@ -1075,7 +1103,7 @@ async def list_approvals(
 )
 async def create_approval(
     payload: ApprovalCreate,
-    board: Board = BOARD_DEP,
+    board: Board = BOARD_ACCESS_DEP,
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
 ) -> ApprovalRead:
@@ -1083,7 +1111,6 @@ async def create_approval(
 
     Include `task_id` or `task_ids` to scope the decision precisely.
     """
-    _guard_board_access(agent_ctx, board)
     return await approvals_api.create_approval(
         payload=payload,
         board=board,
@@ -1114,7 +1141,7 @@ async def create_approval(
 )
 async def update_onboarding(
     payload: BoardOnboardingAgentUpdate,
-    board: Board = BOARD_DEP,
+    board: Board = BOARD_ACCESS_DEP,
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
 ) -> BoardOnboardingSession:
@@ -1122,7 +1149,6 @@ async def update_onboarding(
 
     Used during structured objective/success-metric intake loops.
     """
-    _guard_board_access(agent_ctx, board)
     return await onboarding_api.agent_onboarding_update(
         payload=payload,
         board=board,
@@ -1207,9 +1233,7 @@ async def create_agent(
     The new agent is always forced onto the caller's board (`board_id` override).
     """
     lead = _require_board_lead(agent_ctx)
-    payload = AgentCreate(
-        **{**payload.model_dump(), "board_id": lead.board_id},
-    )
+    payload = payload.model_copy(update={"board_id": lead.board_id})
     return await agents_api.create_agent(
         payload=payload,
         session=session,
@@ -1295,7 +1319,7 @@ async def create_agent(
 async def nudge_agent(
     payload: AgentNudge,
     agent_id: str,
-    board: Board = BOARD_DEP,
+    board: Board = BOARD_ACCESS_DEP,
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
 ) -> OkResponse:
@@ -1303,7 +1327,6 @@ async def nudge_agent(
 
     Lead-only endpoint for stale or blocked in-progress work.
     """
-    _guard_board_access(agent_ctx, board)
     _require_board_lead(agent_ctx)
     coordination = GatewayCoordinationService(session)
     await coordination.nudge_board_agent(
@@ -1415,7 +1438,7 @@ async def agent_heartbeat(
 )
 async def get_agent_soul(
     agent_id: str,
-    board: Board = BOARD_DEP,
+    board: Board = BOARD_ACCESS_DEP,
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
 ) -> str:
@@ -1423,7 +1446,6 @@ async def get_agent_soul(
 
     Allowed for board lead, or for an agent reading its own SOUL.
     """
-    _guard_board_access(agent_ctx, board)
     OpenClawAuthorizationPolicy.require_board_lead_or_same_actor(
         actor_agent=agent_ctx.agent,
         target_agent_id=agent_id,
@@ -1515,7 +1537,7 @@ async def get_agent_soul(
 async def update_agent_soul(
     agent_id: str,
     payload: SoulUpdateRequest,
-    board: Board = BOARD_DEP,
+    board: Board = BOARD_ACCESS_DEP,
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
 ) -> OkResponse:
@@ -1523,7 +1545,6 @@ async def update_agent_soul(
 
     Lead-only endpoint. Persists as `soul_template` for future reprovisioning.
     """
-    _guard_board_access(agent_ctx, board)
     _require_board_lead(agent_ctx)
     coordination = GatewayCoordinationService(session)
     await coordination.update_agent_soul(
@@ -1606,7 +1627,7 @@ async def update_agent_soul(
 )
 async def delete_board_agent(
     agent_id: str,
-    board: Board = BOARD_DEP,
+    board: Board = BOARD_ACCESS_DEP,
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
 ) -> OkResponse:
@@ -1614,7 +1635,6 @@ async def delete_board_agent(
 
     Cleans up runtime/session state through lifecycle services.
     """
-    _guard_board_access(agent_ctx, board)
     _require_board_lead(agent_ctx)
     service = AgentLifecycleService(session)
     return await service.delete_agent_as_lead(
@@ -1696,7 +1716,7 @@ async def delete_board_agent(
 )
 async def ask_user_via_gateway_main(
     payload: GatewayMainAskUserRequest,
-    board: Board = BOARD_DEP,
+    board: Board = BOARD_ACCESS_DEP,
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
 ) -> GatewayMainAskUserResponse:
@@ -1704,7 +1724,6 @@ async def ask_user_via_gateway_main(
 
     Lead-only endpoint for situations where board chat is not responsive.
     """
-    _guard_board_access(agent_ctx, board)
     _require_board_lead(agent_ctx)
     coordination = GatewayCoordinationService(session)
     return await coordination.ask_user_via_gateway_main(
@@ -46,7 +46,7 @@ class _AgentUpdateParams:
     ctx: OrganizationContext
 
 
-def _agent_update_params(
+async def _agent_update_params(
     *,
     force: bool = False,
     auth: AuthContext = AUTH_DEP,
@@ -21,6 +21,7 @@ from app.api.deps import (
     require_admin_or_agent,
 )
 from app.core.logging import get_logger
+from app.core.response_cache import invalidate_board_responses
 from app.core.time import utcnow
 from app.db.pagination import paginate
 from app.db.session import async_session_maker, get_session
@@ -425,6 +426,7 @@ async def create_approval(
     )
     await session.commit()
     await session.refresh(approval)
+    await invalidate_board_responses(board.id)
     title_by_id = await _task_titles_by_id(session, task_ids=set(task_ids))
     return _approval_to_read(
         approval,
@@ -467,6 +469,7 @@ async def update_approval(
     session.add(approval)
     await session.commit()
     await session.refresh(approval)
+    await invalidate_board_responses(board.id)
     if approval.status in {"approved", "rejected"} and approval.status != prior_status:
         try:
             await _notify_lead_on_approval_resolution(
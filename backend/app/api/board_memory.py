@@ -20,6 +20,7 @@ from app.api.deps import (
     require_admin_or_agent,
 )
 from app.core.config import settings
+from app.core.response_cache import invalidate_board_responses
 from app.core.time import utcnow
 from app.db.pagination import paginate
 from app.db.session import async_session_maker, get_session
@@ -296,6 +297,7 @@ async def create_board_memory(
     session.add(memory)
     await session.commit()
     await session.refresh(memory)
+    await invalidate_board_responses(board.id)
     if is_chat:
         await _notify_chat_targets(
             session=session,
@@ -20,6 +20,7 @@ from app.api.deps import (
     require_org_member,
 )
 from app.core.logging import get_logger
+from app.core.response_cache import invalidate_board_responses, invalidate_global_responses
 from app.core.time import utcnow
 from app.db import crud
 from app.db.pagination import paginate
@@ -483,7 +484,9 @@ async def create_board(
     """Create a board in the active organization."""
     data = payload.model_dump()
     data["organization_id"] = ctx.organization.id
-    return await crud.create(session, Board, **data)
+    board = await crud.create(session, Board, **data)
+    await invalidate_global_responses()
+    return board
 
 
 @router.get("/{board_id}", response_model=BoardRead)
@@ -593,6 +596,8 @@ async def update_board(
                 updated.id,
                 sorted(changed_fields),
             )
+    await invalidate_board_responses(updated.id)
+    await invalidate_global_responses()
     return updated
 
 
@@ -602,4 +607,8 @@ async def delete_board(
     board: Board = BOARD_USER_WRITE_DEP,
 ) -> OkResponse:
     """Delete a board and all dependent records."""
-    return await delete_board_service(session, board=board)
+    board_id = board.id
+    result = await delete_board_service(session, board=board)
+    await invalidate_board_responses(board_id)
+    await invalidate_global_responses()
+    return result
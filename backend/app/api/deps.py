@@ -5,7 +5,8 @@ These dependencies are the main "policy wiring" layer for the API.
 They:
 - resolve the authenticated actor (admin user vs agent)
 - enforce organization/board access rules
-- provide common "load or 404" helpers (board/task)
+- provide common "load or 404" helpers (board/task), with board lookups batched
+  and memoized per request by `BoardLoader`
 
 Why this exists:
 - Keeping authorization logic centralized makes it easier to reason about (and
@@ -18,11 +19,12 @@ of re-implementing permission checks in the router.
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 
 from app.core.agent_auth import AgentAuthContext, get_agent_auth_context_optional
 from app.core.auth import AuthContext, get_auth_context, get_auth_context_optional
@@ -40,6 +42,8 @@ from app.services.organizations import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from sqlmodel.ext.asyncio.session import AsyncSession
 
     from app.models.agents import Agent
@@ -51,13 +55,13 @@ AGENT_AUTH_OPTIONAL_DEP = Depends(get_agent_auth_context_optional)
 SESSION_DEP = Depends(get_session)
 
 
-def require_admin_auth(auth: AuthContext = AUTH_DEP) -> AuthContext:
+async def require_admin_auth(auth: AuthContext = AUTH_DEP) -> AuthContext:
     """Require an authenticated admin user."""
     require_admin(auth)
     return auth
 
 
-@dataclass
+@dataclass(slots=True)
 class ActorContext:
     """Authenticated actor context for user or agent callers."""
 
@@ -66,7 +70,7 @@ class ActorContext:
     agent: Agent | None = None
 
 
-def require_admin_or_agent(
+async def require_admin_or_agent(
     auth: AuthContext | None = AUTH_OPTIONAL_DEP,
     agent_auth: AgentAuthContext | None = AGENT_AUTH_OPTIONAL_DEP,
 ) -> ActorContext:
@@ -114,26 +118,100 @@ async def require_org_admin(
     return ctx
 
 
-async def get_board_or_404(
-    board_id: str,
+class BoardLoader:
+    """Request-scoped batching loader for boards (DataLoader-style).
+
+    Lookups queued before the loader yields to the event loop are resolved by a
+    single `WHERE id IN (...)` query, and every resolved id (found or not) is
+    memoized so repeated dependency lookups within a request never re-query.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Bind the loader to the request session."""
+        self._session = session
+        self._boards: dict[UUID, Board | None] = {}
+        self._queued: set[UUID] = set()
+        self._lock = asyncio.Lock()
+
+    def with_session(self, session: AsyncSession) -> BoardLoader:
+        """Return an empty loader bound to another session."""
+        return BoardLoader(session)
+
+    async def load(self, board_id: UUID) -> Board | None:
+        """Return one board by id, or `None` when it does not exist."""
+        (board,) = await self.load_many((board_id,))
+        return board
+
+    async def load_many(self, board_ids: Iterable[UUID]) -> list[Board | None]:
+        """Return boards in input order, batching ids not yet resolved."""
+        ids = list(board_ids)
+        missing = {board_id for board_id in ids if board_id not in self._boards}
+        if missing:
+            self._queued.update(missing)
+            # Let concurrent loads join the batch before it is dispatched.
+            await asyncio.sleep(0)
+            await self._dispatch()
+        return [self._boards.get(board_id) for board_id in ids]
+
+    async def _dispatch(self) -> None:
+        async with self._lock:
+            pending = [board_id for board_id in self._queued if board_id not in self._boards]
+            self._queued.clear()
+            if not pending:
+                return
+            if len(pending) == 1:
+                # Lone misses go through the identity map before hitting the DB.
+                (board_id,) = pending
+                self._boards[board_id] = await Board.objects.get(self._session, board_id)
+                return
+            boards = await Board.objects.by_ids(pending).all(self._session)
+            found = {board.id: board for board in boards}
+            for board_id in pending:
+                self._boards[board_id] = found.get(board_id)
+
+
+async def get_board_loader(
+    request: Request,
     session: AsyncSession = SESSION_DEP,
-) -> Board:
-    """Load a board by id or raise HTTP 404."""
-    board = await Board.objects.by_id(board_id).first(session)
+) -> BoardLoader:
+    """Return the board loader cached on the current request."""
+    loader = getattr(request.state, "board_loader", None)
+    if not isinstance(loader, BoardLoader):
+        loader = BoardLoader(session)
+        request.state.board_loader = loader
+    return loader
+
+
+BOARD_LOADER_DEP = Depends(get_board_loader)
+
+
+async def _load_board_or_404(loader: BoardLoader, board_id: str) -> Board:
+    try:
+        board_uuid = UUID(board_id)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND) from None
+    board = await loader.load(board_uuid)
     if board is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     return board
 
 
+async def get_board_or_404(
+    board_id: str,
+    loader: BoardLoader = BOARD_LOADER_DEP,
+) -> Board:
+    """Load a board by id or raise HTTP 404."""
+    return await _load_board_or_404(loader, board_id)
+
+
 async def get_board_for_actor_read(
     board_id: str,
     session: AsyncSession = SESSION_DEP,
     actor: ActorContext = ACTOR_DEP,
+    loader: BoardLoader = BOARD_LOADER_DEP,
 ) -> Board:
     """Load a board and enforce actor read access."""
-    board = await Board.objects.by_id(board_id).first(session)
-    if board is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    board = await _load_board_or_404(loader, board_id)
     if actor.actor_type == "agent":
         if actor.agent and actor.agent.board_id and actor.agent.board_id != board.id:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
@@ -148,11 +226,10 @@ async def get_board_for_actor_write(
     board_id: str,
     session: AsyncSession = SESSION_DEP,
     actor: ActorContext = ACTOR_DEP,
+    loader: BoardLoader = BOARD_LOADER_DEP,
 ) -> Board:
     """Load a board and enforce actor write access."""
-    board = await Board.objects.by_id(board_id).first(session)
-    if board is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    board = await _load_board_or_404(loader, board_id)
     if actor.actor_type == "agent":
         if actor.agent and actor.agent.board_id and actor.agent.board_id != board.id:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
@@ -202,7 +279,7 @@ async def get_task_or_404(
     session: AsyncSession = SESSION_DEP,
 ) -> Task:
     """Load a task for a board or raise HTTP 404."""
-    task = await Task.objects.by_id(task_id).first(session)
+    task = await Task.objects.get(session, task_id)
     if task is None or task.board_id != board.id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     return task
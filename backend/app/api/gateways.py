@@ -47,7 +47,7 @@ BOARD_ID_QUERY = Query(default=None)
 _RUNTIME_TYPE_REFERENCES = (UUID,)
 
 
-def _template_sync_query(
+async def _template_sync_query(
     *,
     include_main: bool = INCLUDE_MAIN_QUERY,
     lead_only: bool = LEAD_ONLY_QUERY,
@@ -8,6 +8,9 @@ Key ideas:
   for agents (controlled by caller/dependency).
 - To reduce write-amplification, we only touch `Agent.last_seen_at` at a fixed
   interval and we avoid touching it for safe/read-only HTTP methods.
+- Token verification is expensive, so the resolved context is memoized on
+  `request.state`; the required and optional dependencies share one lookup per
+  request even when both appear in a route's dependency tree.
 
 This is intentionally separate from user authentication (Clerk/local bearer token)
 so we can evolve agent policy independently.
@@ -46,6 +49,12 @@ class AgentAuthContext:
     agent: Agent
 
 
+@dataclass(frozen=True, slots=True)
+class _RequestAgentAuth:
+    token: str
+    context: AgentAuthContext | None
+
+
 async def _find_agent_for_token(session: AsyncSession, token: str) -> Agent | None:
     agents = list(
         await session.exec(
@@ -105,6 +114,24 @@ async def _touch_agent_presence(
         await session.commit()
 
 
+async def _resolve_agent_auth_context(
+    request: Request,
+    session: AsyncSession,
+    token: str,
+) -> AgentAuthContext | None:
+    """Resolve `token` to an agent context once per request."""
+    cached = getattr(request.state, "agent_auth", None)
+    if isinstance(cached, _RequestAgentAuth) and cached.token == token:
+        return cached.context
+    agent = await _find_agent_for_token(session, token)
+    context = None
+    if agent is not None:
+        await _touch_agent_presence(request, session, agent)
+        context = AgentAuthContext(actor_type="agent", agent=agent)
+    request.state.agent_auth = _RequestAgentAuth(token=token, context=context)
+    return context
+
+
 async def get_agent_auth_context(
     request: Request,
     agent_token: str | None = Header(default=None, alias="X-Agent-Token"),
@@ -125,16 +152,15 @@ async def get_agent_auth_context(
             bool(authorization),
         )
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
-    agent = await _find_agent_for_token(session, resolved)
-    if agent is None:
+    context = await _resolve_agent_auth_context(request, session, resolved)
+    if context is None:
         logger.warning(
             "agent auth invalid token path=%s token_prefix=%s",
             request.url.path,
             resolved[:6],
         )
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
-    await _touch_agent_presence(request, session, agent)
-    return AgentAuthContext(actor_type="agent", agent=agent)
+    return context
 
 
 async def get_agent_auth_context_optional(
@@ -166,14 +192,11 @@ async def get_agent_auth_context_optional(
                 bool(authorization),
             )
         return None
-    agent = await _find_agent_for_token(session, resolved)
-    if agent is None:
-        if agent_token:
-            logger.warning(
-                "agent auth optional invalid token path=%s token_prefix=%s",
-                request.url.path,
-                resolved[:6],
-            )
-        return None
-    await _touch_agent_presence(request, session, agent)
-    return AgentAuthContext(actor_type="agent", agent=agent)
+    context = await _resolve_agent_auth_context(request, session, resolved)
+    if context is None and agent_token:
+        logger.warning(
+            "agent auth optional invalid token path=%s token_prefix=%s",
+            request.url.path,
+            resolved[:6],
+        )
+    return context
@@ -57,6 +57,9 @@ class Settings(BaseSettings):
 
     # Database lifecycle
     db_auto_migrate: bool = False
+    # Warn when a request repeats one SQL statement this many times (0 disables).
+    # Never installed when ENVIRONMENT=production.
+    db_query_repeat_warn_threshold: int = Field(default=3, ge=0)
 
     # RQ queueing / dispatch
     rq_redis_url: str = "redis://localhost:6379/0"
@@ -66,6 +69,12 @@ class Settings(BaseSettings):
     rq_dispatch_retry_base_seconds: float = 10.0
     rq_dispatch_retry_max_seconds: float = 120.0
 
+    # Agent endpoint response cache (blank disables caching)
+    response_cache_redis_url: str = ""
+
+    # Presence-only agent heartbeats are written in batches this often (0 disables).
+    agent_heartbeat_flush_seconds: float = Field(default=1.0, ge=0)
+
     # OpenClaw gateway runtime compatibility
     gateway_min_version: str = "2026.02.9"
 
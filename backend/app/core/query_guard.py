@@ -0,0 +1,83 @@
+"""ASGI middleware that flags repeated SQL statements (N+1 queries) per request."""
+
+from __future__ import annotations
+
+from collections import Counter
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.logging import get_logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = get_logger(__name__)
+
+_request_statements: ContextVar[Counter[str] | None] = ContextVar(
+    "request_statements",
+    default=None,
+)
+
+
+def _count_statement(_conn: object, _cursor: object, statement: str, *_args: object) -> None:
+    counts = _request_statements.get()
+    if counts is not None:
+        counts[statement] += 1
+
+
+class QueryRepeatGuardMiddleware:
+    """Warn when one request executes the same SQL statement `threshold` or more times.
+
+    Identical statement text with different parameters is the signature of a
+    per-row lookup inside a loop. Intended for dev/test only; production does
+    not install it. Streaming (SSE) responses are skipped because their poll
+    loops repeat statements by design.
+    """
+
+    _EVENT_STREAM = b"text/event-stream"
+
+    def __init__(self, app: ASGIApp, *, threshold: int = 3) -> None:
+        self._app = app
+        self._threshold = threshold
+        if not event.contains(Engine, "before_cursor_execute", _count_statement):
+            event.listen(Engine, "before_cursor_execute", _count_statement)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Count statements executed while serving the request and report repeats."""
+        if scope["type"] != "http" or self._threshold <= 0:
+            await self._app(scope, receive, send)
+            return
+
+        counts: Counter[str] = Counter()
+        streaming = False
+
+        async def send_tracking_stream(message: Message) -> None:
+            nonlocal streaming
+            if message["type"] == "http.response.start":
+                for key, value in message.get("headers", []):
+                    if key.lower() == b"content-type" and value.startswith(self._EVENT_STREAM):
+                        streaming = True
+            await send(message)
+
+        token = _request_statements.set(counts)
+        try:
+            await self._app(scope, receive, send_tracking_stream)
+        finally:
+            _request_statements.reset(token)
+        if not streaming:
+            self._report(scope, counts)
+
+    def _report(self, scope: Scope, counts: Counter[str]) -> None:
+        for statement, count in counts.items():
+            if count < self._threshold:
+                continue
+            logger.warning(
+                "db.query_guard.repeated_statement method=%s path=%s count=%s statement=%s",
+                scope.get("method"),
+                scope.get("path"),
+                count,
+                " ".join(statement.split()),
+            )
@@ -0,0 +1,418 @@
+"""Redis-backed response cache for read-mostly agent polling endpoints.
+
+Agents poll board-scoped list endpoints (boards, tasks, comments, memory, approvals)
+far more often than the underlying rows change. `cached_response` stores the
+serialized JSON body of a handler's response model in Redis so repeat polls skip
+the database and response-model serialization entirely.
+
+Key ideas:
+- Entries are keyed by request path, sorted query params, and the caller's agent
+  board scope, and are grouped per board so writes can drop every cached view of
+  that board at once (`invalidate_board_responses`). Agents without a board share
+  a `global` scope that board create/update/delete clear
+  (`invalidate_global_responses`).
+- Each entry is a Redis hash holding the body and a `stale_at` timestamp. Fresh
+  entries are served directly; stale entries are still served while one
+  background refresh rebuilds them (stale-while-revalidate).
+- Invalidation also bumps a per-scope generation counter. Entries record the
+  generation read before they were rendered and are ignored once it moves on, so
+  a refresh that finishes after a write cannot reinstall the pre-write body.
+- The cache is best-effort: Redis errors are logged and the handler runs uncached.
+
+Caching is disabled unless `RESPONSE_CACHE_REDIS_URL` is configured.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import math
+import time
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Literal,
+    ParamSpec,
+    Protocol,
+    TypeVar,
+    cast,
+    runtime_checkable,
+)
+from urllib.parse import urlencode
+from uuid import UUID
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.agent_auth import AgentAuthContext
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.session import async_session_maker
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+logger = get_logger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+CachePolicyName = Literal["short", "normal"]
+
+
+@dataclass(frozen=True, slots=True)
+class CachePolicy:
+    """Freshness window and stale-serving grace period for cached responses."""
+
+    ttl_seconds: float
+    stale_seconds: float
+
+    @property
+    def expire_seconds(self) -> int:
+        """Return the Redis key lifetime covering both fresh and stale windows."""
+        return math.ceil(self.ttl_seconds + self.stale_seconds)
+
+
+CACHE_POLICIES: dict[str, CachePolicy] = {
+    "short": CachePolicy(ttl_seconds=5, stale_seconds=25),
+    "normal": CachePolicy(ttl_seconds=30, stale_seconds=30),
+}
+
+_KEY_PREFIX = "mc:response-cache"
+_GLOBAL_SCOPE = "global"
+_INDEX_EXPIRE_SECONDS = max(policy.expire_seconds for policy in CACHE_POLICIES.values())
+_REFRESH_LOCK_SECONDS = 10
+# Must outlive every entry so an expired counter can never reuse a live value.
+_GENERATION_EXPIRE_SECONDS = 24 * 60 * 60
+_REQUEST_PARAM = "_response_cache_request"
+_SESSION_PARAM = "session"
+_MEDIA_TYPE = "application/json"
+
+
+@runtime_checkable
+class SessionBound(Protocol):
+    """Handler argument holding request-session state that must be rebound on refresh."""
+
+    def with_session(self, session: AsyncSession) -> object:
+        """Return an equivalent object bound to `session`."""
+        ...
+
+
+# Strong references so in-flight refresh tasks are not garbage collected.
+_background_refreshes: set[asyncio.Task[None]] = set()
+
+
+@functools.cache
+def _client_for_url(redis_url: str) -> Redis:
+    return cast(Redis, Redis.from_url(redis_url))
+
+
+def _redis_client() -> Redis | None:
+    redis_url = settings.response_cache_redis_url.strip()
+    if not redis_url:
+        return None
+    return _client_for_url(redis_url)
+
+
+@functools.cache
+def _response_adapter(response_model: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(response_model)
+
+
+def _scope_index_key(scope: str) -> str:
+    return f"{_KEY_PREFIX}:{scope}:keys"
+
+
+def _generation_key(scope: str) -> str:
+    return f"{_KEY_PREFIX}:{scope}:generation"
+
+
+def _refresh_lock_key(key: str) -> str:
+    return f"{key}:refresh"
+
+
+def _agent_board_id(kwargs: dict[str, Any]) -> UUID | None:
+    agent_ctx = kwargs.get("agent_ctx")
+    if isinstance(agent_ctx, AgentAuthContext):
+        return agent_ctx.agent.board_id
+    return None
+
+
+def _board_scope(request: Request, agent_board_id: UUID | None) -> str:
+    raw_board_id = request.path_params.get("board_id")
+    if raw_board_id is None:
+        return str(agent_board_id) if agent_board_id else _GLOBAL_SCOPE
+    try:
+        return str(UUID(str(raw_board_id)))
+    except ValueError:
+        return str(raw_board_id)
+
+
+def _cache_key(request: Request, *, scope: str, agent_board_id: UUID | None) -> str:
+    query = urlencode(sorted(request.query_params.multi_items()))
+    raw = f"{request.url.path}?{query}:{agent_board_id}"
+    digest = hashlib.sha1(raw.encode("utf-8"), usedforsecurity=False).hexdigest()
+    return f"{_KEY_PREFIX}:{scope}:{digest}"
+
+
+def _adapter_for_request(request: Request) -> TypeAdapter[Any] | None:
+    response_model = getattr(request.scope.get("route"), "response_model", None)
+    if response_model is None:
+        return None
+    return _response_adapter(response_model)
+
+
+def _render(adapter: TypeAdapter[Any], result: object) -> bytes:
+    validated = adapter.validate_python(result, from_attributes=True)
+    return adapter.dump_json(validated, by_alias=True)
+
+
+def _json_response(body: bytes) -> Response:
+    return Response(content=body, media_type=_MEDIA_TYPE)
+
+
+async def _store(
+    client: Redis,
+    *,
+    key: str,
+    scope: str,
+    body: bytes,
+    generation: bytes,
+    policy: CachePolicy,
+) -> None:
+    index_key = _scope_index_key(scope)
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.hset(
+                key,
+                mapping={
+                    "body": body,
+                    "generation": generation,
+                    "stale_at": time.time() + policy.ttl_seconds,
+                },
+            )
+            pipe.expire(key, policy.expire_seconds)
+            pipe.sadd(index_key, key)
+            pipe.expire(index_key, _INDEX_EXPIRE_SECONDS)
+            await pipe.execute()
+    except RedisError as exc:
+        logger.warning(
+            "response_cache.store_failed",
+            extra={"cache_key": key, "error": str(exc)},
+        )
+
+
+async def _refresh(
+    func: Callable[..., Awaitable[object]],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    *,
+    client: Redis,
+    adapter: TypeAdapter[Any],
+    key: str,
+    scope: str,
+    generation: bytes,
+    policy: CachePolicy,
+) -> None:
+    try:
+        # The request-scoped session is closed once the response is sent, so the
+        # refresh runs the handler (and any session-bound helpers) on its own session.
+        async with async_session_maker() as session:
+            refresh_kwargs: dict[str, Any] = {}
+            for name, value in kwargs.items():
+                if name == _SESSION_PARAM:
+                    value = session
+                elif isinstance(value, SessionBound):
+                    value = value.with_session(session)
+                refresh_kwargs[name] = value
+            body = _render(adapter, await func(*args, **refresh_kwargs))
+        await _store(
+            client,
+            key=key,
+            scope=scope,
+            body=body,
+            generation=generation,
+            policy=policy,
+        )
+    except Exception as exc:
+        logger.warning(
+            "response_cache.refresh_failed",
+            extra={"cache_key": key, "error": str(exc)},
+        )
+    finally:
+        # Release the lock so the next stale hit can refresh again.
+        try:
+            await client.delete(_refresh_lock_key(key))
+        except RedisError as exc:
+            logger.warning(
+                "response_cache.refresh_unlock_failed",
+                extra={"cache_key": key, "error": str(exc)},
+            )
+
+
+async def _schedule_refresh(
+    func: Callable[..., Awaitable[object]],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    *,
+    client: Redis,
+    adapter: TypeAdapter[Any],
+    key: str,
+    scope: str,
+    generation: bytes,
+    policy: CachePolicy,
+) -> None:
+    try:
+        acquired = await client.set(
+            _refresh_lock_key(key),
+            b"1",
+            nx=True,
+            ex=_REFRESH_LOCK_SECONDS,
+        )
+    except RedisError as exc:
+        logger.warning(
+            "response_cache.refresh_lock_failed",
+            extra={"cache_key": key, "error": str(exc)},
+        )
+        return
+    if not acquired:
+        return
+    task = asyncio.create_task(
+        _refresh(
+            func,
+            args,
+            kwargs,
+            client=client,
+            adapter=adapter,
+            key=key,
+            scope=scope,
+            generation=generation,
+            policy=policy,
+        ),
+    )
+    _background_refreshes.add(task)
+    task.add_done_callback(_background_refreshes.discard)
+
+
+def cached_response(
+    *,
+    policy: CachePolicyName = "normal",
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R | Response]]]:
+    """Cache a GET handler's serialized response model in Redis.
+
+    The decorated handler must sit directly beneath the router decorator so the
+    route's `response_model` can be used to serialize results. Cached and freshly
+    rendered bodies are both returned as raw JSON responses.
+    """
+    cache_policy = CACHE_POLICIES[policy]
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R | Response]]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R | Response:
+            request = kwargs.pop(_REQUEST_PARAM, None)
+            client = _redis_client()
+            if client is None or not isinstance(request, Request):
+                return await func(*args, **kwargs)
+            adapter = _adapter_for_request(request)
+            if adapter is None:
+                return await func(*args, **kwargs)
+
+            agent_board_id = _agent_board_id(kwargs)
+            scope = _board_scope(request, agent_board_id)
+            key = _cache_key(request, scope=scope, agent_board_id=agent_board_id)
+            try:
+                async with client.pipeline(transaction=False) as pipe:
+                    pipe.hgetall(key)
+                    pipe.get(_generation_key(scope))
+                    cached, raw_generation = await pipe.execute()
+            except RedisError as exc:
+                logger.warning(
+                    "response_cache.read_failed",
+                    extra={"cache_key": key, "error": str(exc)},
+                )
+                return await func(*args, **kwargs)
+
+            # Read before rendering: a write that lands mid-render bumps the
+            # generation and orphans whatever this request (or refresh) stores.
+            generation: bytes = raw_generation or b"0"
+            body = cached.get(b"body") if cached.get(b"generation") == generation else None
+            if body is not None:
+                if time.time() >= float(cached.get(b"stale_at", 0)):
+                    await _schedule_refresh(
+                        func,
+                        args,
+                        kwargs,
+                        client=client,
+                        adapter=adapter,
+                        key=key,
+                        scope=scope,
+                        generation=generation,
+                        policy=cache_policy,
+                    )
+                return _json_response(body)
+
+            body = _render(adapter, await func(*args, **kwargs))
+            await _store(
+                client,
+                key=key,
+                scope=scope,
+                body=body,
+                generation=generation,
+                policy=cache_policy,
+            )
+            return _json_response(body)
+
+        request_param = inspect.Parameter(
+            _REQUEST_PARAM,
+            inspect.Parameter.KEYWORD_ONLY,
+            annotation=Request,
+        )
+        setattr(
+            wrapper,
+            "__signature__",
+            signature.replace(parameters=[*signature.parameters.values(), request_param]),
+        )
+        return wrapper
+
+    return decorator
+
+
+async def _invalidate_scope(scope: str) -> None:
+    client = _redis_client()
+    if client is None:
+        return
+    index_key = _scope_index_key(scope)
+    generation_key = _generation_key(scope)
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.incr(generation_key)
+            pipe.expire(generation_key, _GENERATION_EXPIRE_SECONDS)
+            await pipe.execute()
+        keys = await cast("Awaitable[set[bytes]]", client.smembers(index_key))
+        await client.delete(index_key, *keys)
+    except RedisError as exc:
+        logger.warning(
+            "response_cache.invalidate_failed",
+            extra={"scope": scope, "error": str(exc)},
+        )
+
+
+async def invalidate_board_responses(board_id: UUID | None) -> None:
+    """Drop every cached response scoped to a board after a write."""
+    if board_id is None:
+        return
+    await _invalidate_scope(str(board_id))
+
+
+async def invalidate_global_responses() -> None:
+    """Drop cached responses served to agents without a board after a board write."""
+    await _invalidate_scope(_GLOBAL_SCOPE)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Awaitable, Callable, Sequence
 from typing import TYPE_CHECKING, Any, TypeVar
 
+from fastapi_pagination import paginate as _paginate_sequence
 from fastapi_pagination.ext.sqlalchemy import paginate as _paginate
 
 from app.schemas.pagination import DefaultLimitOffsetPage
@@ -31,3 +32,10 @@ async def paginate(
     """Execute a paginated query and cast to the project page type alias."""
     page = await _paginate(session, statement, transformer=transformer)
     return DefaultLimitOffsetPage[T].model_validate(page)
+
+
+def paginate_items(items: Sequence[T]) -> LimitOffsetPage[T]:
+    """Paginate already-loaded items and cast to the project page type alias."""
+    # `safe=True` skips the ORM-extension nag; the items are already materialized.
+    page = _paginate_sequence(items, safe=True)
+    return DefaultLimitOffsetPage[T].model_validate(page)
@@ -2,22 +2,61 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from sqlalchemy import false
-from sqlmodel import SQLModel, col
+from sqlalchemy.orm import class_mapper, selectinload
+from sqlmodel import SQLModel, col, select
 
 from app.db.queryset import QuerySet, qs
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+    from sqlalchemy.orm import Mapped
+    from sqlalchemy.orm.strategy_options import _AbstractLoad
     from sqlalchemy.sql.elements import ColumnElement
+    from sqlmodel.ext.asyncio.session import AsyncSession
+    from sqlmodel.sql.expression import SelectOfScalar
 
 ModelT = TypeVar("ModelT", bound=SQLModel)
 
 
+def _selectin_path(model: type[SQLModel], path: str) -> _AbstractLoad:
+    """Build a chained `selectinload` option for a dotted relationship path."""
+    mapper = class_mapper(model)
+    option: _AbstractLoad | None = None
+    for name in path.split("."):
+        relationship = mapper.relationships.get(name)
+        if relationship is None:
+            msg = f"{mapper.class_.__name__}.{name} is not a relationship"
+            raise ValueError(msg)
+        attribute = getattr(mapper.class_, name)
+        option = selectinload(attribute) if option is None else option.selectinload(attribute)
+        mapper = relationship.mapper
+    if option is None:
+        msg = "Relationship path must not be empty"
+        raise ValueError(msg)
+    return option
+
+
+@functools.lru_cache(maxsize=512)
+def _base_statement(model: type[SQLModel]) -> SelectOfScalar[Any]:
+    """Return the shared `SELECT model` statement (selects are immutable/generative)."""
+    return select(model)
+
+
+@functools.lru_cache(maxsize=512)
+def _filter_by_columns(
+    model: type[SQLModel],
+    field_names: tuple[str, ...],
+) -> tuple[Mapped[Any], ...]:
+    """Resolve `filter_by` keyword names to model columns once per call shape."""
+    return tuple(col(getattr(model, field_name)) for field_name in field_names)
+
+
 @dataclass(frozen=True)
 class ModelManager(Generic[ModelT]):
     """Convenience query manager bound to a SQLModel class."""
@@ -25,9 +64,20 @@ class ModelManager(Generic[ModelT]):
     model: type[ModelT]
     id_field: str = "id"
 
-    def all(self) -> QuerySet[ModelT]:
-        """Return an unfiltered queryset for the bound model."""
-        return qs(self.model)
+    def all(self, *, loads: tuple[str, ...] = ()) -> QuerySet[ModelT]:
+        """Return an unfiltered queryset, eager-loading any `loads` relationships."""
+        queryset: QuerySet[ModelT] = QuerySet(_base_statement(self.model))
+        if loads:
+            queryset = queryset.options(*(_selectin_path(self.model, path) for path in loads))
+        return queryset
+
+    def with_loads(self, *relationships: str) -> QuerySet[ModelT]:
+        """Return a queryset that `selectinload`s the named (optionally dotted) relationships.
+
+        Use this instead of relying on lazy loads when serializing related rows for
+        a list of parents, e.g. `Model.objects.with_loads("children.owner")`.
+        """
+        return self.all(loads=relationships)
 
     def none(self) -> QuerySet[ModelT]:
         """Return a queryset that yields no rows."""
@@ -48,14 +98,29 @@ class ModelManager(Generic[ModelT]):
         return self.filter(*criteria)
 
     def filter_by(self, **kwargs: object) -> QuerySet[ModelT]:
-        """Return queryset filtered by model field equality values."""
-        queryset = self.all()
-        for field_name, value in kwargs.items():
-            queryset = queryset.filter(col(getattr(self.model, field_name)) == value)
-        return queryset
+        """Return queryset filtered by model field equality values.
+
+        Column lookups are cached per `(model, field names)` shape and all criteria
+        are applied in one `WHERE`; SQLAlchemy's compiled cache then reuses the SQL
+        string for every call with the same shape.
+        """
+        if not kwargs:
+            return self.all()
+        columns = _filter_by_columns(self.model, tuple(kwargs))
+        criteria = [column == value for column, value in zip(columns, kwargs.values())]
+        return self.all().filter(*criteria)
+
+    async def get(self, session: AsyncSession, obj_id: object) -> ModelT | None:
+        """Return one row by primary key, checking the session identity map first.
+
+        This is the fast path for plain primary-key lookups: a row already loaded
+        in `session` is returned without a query. Use `by_id()` instead when the
+        lookup needs further filtering or must bypass the identity map.
+        """
+        return await session.get(self.model, obj_id)
 
     def by_id(self, obj_id: object) -> QuerySet[ModelT]:
-        """Return queryset filtered by primary identifier field."""
+        """Return a queryset filtered by the identifier field, for further chaining."""
         return self.by_field(self.id_field, obj_id)
 
     def by_ids(
@@ -74,17 +139,30 @@ class ModelManager(Generic[ModelT]):
         field_name: str,
         values: Iterable[object],
     ) -> QuerySet[ModelT]:
-        """Return queryset filtered by `field IN values` semantics."""
-        seq = tuple(values)
+        """Return queryset filtered by `field IN values` semantics.
+
+        Empty inputs short-circuit to `none()` and a single non-null value emits
+        `field = :value`, which plans better than a one-element `IN`.
+        """
+        seq = values if isinstance(values, (list, tuple)) else tuple(values)
         if not seq:
             return self.none()
+        if len(seq) == 1 and seq[0] is not None:
+            return self.by_field(field_name, seq[0])
         return self.filter(col(getattr(self.model, field_name)).in_(seq))
 
 
 class ManagerDescriptor(Generic[ModelT]):
     """Descriptor that exposes a model-bound `ModelManager` as `.objects`."""
 
-    # noinspection PyMethodMayBeStatic
+    def __init__(self) -> None:
+        """Initialize the per-model manager cache."""
+        # Managers are immutable, so one instance per model class is shared.
+        self._managers: dict[type[ModelT], ModelManager[ModelT]] = {}
+
     def __get__(self, instance: object, owner: type[ModelT]) -> ModelManager[ModelT]:
-        """Return a fresh manager bound to the owning model class."""
-        return ModelManager(owner)
+        """Return the manager bound to the owning model class."""
+        manager = self._managers.get(owner)
+        if manager is None:
+            manager = self._managers[owner] = ModelManager(owner)
+        return manager
@@ -9,6 +9,7 @@ from sqlmodel import select
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Mapped
+    from sqlalchemy.sql.base import ExecutableOption
     from sqlalchemy.sql.elements import ColumnElement
     from sqlmodel.ext.asyncio.session import AsyncSession
     from sqlmodel.sql.expression import SelectOfScalar
@@ -50,6 +51,10 @@ class QuerySet(Generic[ModelT]):
         statement = self.statement.order_by(*ordering)
         return replace(self, statement=statement)
 
+    def options(self, *loader_options: ExecutableOption) -> QuerySet[ModelT]:
+        """Return a new queryset with ORM loader options applied."""
+        return replace(self, statement=self.statement.options(*loader_options))
+
     def limit(self, value: int) -> QuerySet[ModelT]:
         """Return a new queryset with a SQL row limit."""
         return replace(self, statement=self.statement.limit(value))
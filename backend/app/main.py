@@ -34,9 +34,11 @@ from app.api.users import router as users_router
 from app.core.config import settings
 from app.core.error_handling import install_error_handling
 from app.core.logging import configure_logging, get_logger
+from app.core.query_guard import QueryRepeatGuardMiddleware
 from app.core.security_headers import SecurityHeadersMiddleware
 from app.db.session import init_db
 from app.schemas.health import HealthStatusResponse
+from app.services.openclaw.heartbeat_batcher import heartbeat_batcher
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
@@ -437,10 +439,12 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
         settings.db_auto_migrate,
     )
     await init_db()
+    heartbeat_batcher.start(settings.agent_heartbeat_flush_seconds)
     logger.info("app.lifecycle.started")
     try:
         yield
     finally:
+        await heartbeat_batcher.stop()
         logger.info("app.lifecycle.stopped")
 
 
@@ -472,6 +476,11 @@ app.add_middleware(
     referrer_policy=settings.security_header_referrer_policy,
     permissions_policy=settings.security_header_permissions_policy,
 )
+if settings.environment != "production":
+    app.add_middleware(
+        QueryRepeatGuardMiddleware,
+        threshold=settings.db_query_repeat_warn_threshold,
+    )
 install_error_handling(app)
 
 
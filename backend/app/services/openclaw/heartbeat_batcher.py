@@ -0,0 +1,131 @@
+"""Debounced, batched persistence of routine agent heartbeats.
+
+A heartbeat that changes nothing but the agent's presence timestamps does not
+need its own transaction. Such heartbeats are queued in-process and a single
+background task writes them every flush interval as one multi-row
+`UPDATE agents ... CASE id WHEN ... END WHERE id IN (...)`, latest heartbeat
+per agent winning. Heartbeats that change agent state are never queued, and
+a queued heartbeat never moves `last_seen_at` backwards past one written since.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from sqlalchemy import case, or_, update
+from sqlmodel import col
+
+from app.core.logging import get_logger
+from app.db.session import async_session_maker
+from app.models.agents import Agent
+from app.services.activity_log import record_activity
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from uuid import UUID
+
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+logger = get_logger(__name__)
+
+
+@dataclass(slots=True)
+class _PendingHeartbeat:
+    seen_at: datetime
+    agent_name: str
+
+
+class HeartbeatBatcher:
+    """Coalesce presence-only heartbeats and flush them on a fixed interval."""
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession] = async_session_maker,
+    ) -> None:
+        self._session_maker = session_maker
+        self._pending: dict[UUID, _PendingHeartbeat] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = asyncio.Event()
+
+    @property
+    def running(self) -> bool:
+        """Return whether the background flush loop is active."""
+        return self._task is not None and not self._task.done()
+
+    def enqueue(self, *, agent_id: UUID, seen_at: datetime, agent_name: str) -> bool:
+        """Queue a presence-only heartbeat; return False when batching is inactive."""
+        if not self.running:
+            return False
+        self._pending[agent_id] = _PendingHeartbeat(seen_at=seen_at, agent_name=agent_name)
+        return True
+
+    def start(self, interval_seconds: float) -> None:
+        """Start the flush loop; a non-positive interval leaves batching disabled."""
+        if interval_seconds <= 0 or self.running:
+            return
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self._run(interval_seconds))
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write anything still queued.
+
+        The loop is signalled rather than cancelled so a flush already in
+        progress completes before the final one runs.
+        """
+        task, self._task = self._task, None
+        if task is not None:
+            self._stopping.set()
+            await task
+        await self.flush()
+
+    async def flush(self) -> int:
+        """Persist queued heartbeats in one statement and return how many rows changed.
+
+        Agents deleted since enqueue, or already holding a newer `last_seen_at`,
+        are skipped. On failure the batch is merged back for the next flush.
+        """
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, {}
+        seen_at_by_id = {agent_id: entry.seen_at for agent_id, entry in pending.items()}
+        seen_at = case(seen_at_by_id, value=col(Agent.id))
+        statement = (
+            update(Agent)
+            .where(
+                col(Agent.id).in_(seen_at_by_id),
+                or_(col(Agent.last_seen_at).is_(None), col(Agent.last_seen_at) < seen_at),
+            )
+            .values(last_seen_at=seen_at, updated_at=seen_at)
+            .returning(col(Agent.id))
+        )
+        try:
+            async with self._session_maker() as session:
+                updated_ids = list((await session.exec(statement)).scalars())
+                for agent_id in updated_ids:
+                    record_activity(
+                        session,
+                        event_type="agent.heartbeat",
+                        message=f"Heartbeat received from {pending[agent_id].agent_name}.",
+                        agent_id=agent_id,
+                    )
+                await session.commit()
+        except Exception:
+            logger.exception("agent.heartbeat.flush.failed count=%s", len(pending))
+            # Heartbeats queued while this flush ran are newer; keep those.
+            for agent_id, entry in pending.items():
+                self._pending.setdefault(agent_id, entry)
+            return 0
+        return len(updated_ids)
+
+    async def _run(self, interval_seconds: float) -> None:
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=interval_seconds)
+            except TimeoutError:
+                await self.flush()
+
+
+heartbeat_batcher = HeartbeatBatcher()
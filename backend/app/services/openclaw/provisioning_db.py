@@ -18,6 +18,7 @@ from uuid import UUID, uuid4
 
 from fastapi import HTTPException, Request, status
 from sqlalchemy import asc, func, or_
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlmodel import col, select
 from sse_starlette.sse import EventSourceResponse
 
@@ -66,6 +67,7 @@ from app.services.openclaw.gateway_rpc import (
     ensure_session,
     send_message,
 )
+from app.services.openclaw.heartbeat_batcher import heartbeat_batcher
 from app.services.openclaw.internal.agent_key import agent_key as _agent_key
 from app.services.openclaw.internal.retry import GatewayBackoff
 from app.services.openclaw.internal.session_keys import (
@@ -974,7 +976,7 @@ class AgentLifecycleService(OpenClawDBService):
                 actor_agent=actor.agent,
                 requested_board_id=payload.board_id,
             )
-            return AgentCreate(**{**payload.model_dump(), "board_id": board_id})
+            return payload.model_copy(update={"board_id": board_id})
 
         return payload
 
@@ -1426,20 +1428,41 @@ class AgentLifecycleService(OpenClawDBService):
         agent: Agent,
         status_value: str | None,
     ) -> AgentRead:
-        if status_value:
-            agent.status = status_value
-        elif agent.status == "provisioning":
-            agent.status = "online"
-        agent.last_seen_at = utcnow()
+        now = utcnow()
+        updates: dict[str, Any] = {"last_seen_at": now, "updated_at": now}
+        next_status = status_value or agent.status
+        if not status_value and agent.status == "provisioning":
+            next_status = "online"
         # Successful check-in ends the current wake escalation cycle.
-        agent.wake_attempts = 0
-        agent.checkin_deadline_at = None
-        agent.last_provision_error = None
-        agent.updated_at = utcnow()
-        self.record_heartbeat(self.session, agent)
-        self.session.add(agent)
-        await self.session.commit()
-        await self.session.refresh(agent)
+        for field_name, value in (
+            ("status", next_status),
+            ("wake_attempts", 0),
+            ("checkin_deadline_at", None),
+            ("last_provision_error", None),
+        ):
+            if getattr(agent, field_name) != value:
+                updates[field_name] = value
+        # Presence-only check-ins with nothing else pending in the session are
+        # handed to the batcher, which writes them together with other agents'.
+        batched = (
+            updates.keys() == {"last_seen_at", "updated_at"}
+            and not (self.session.new or self.session.dirty or self.session.deleted)
+            and heartbeat_batcher.enqueue(agent_id=agent.id, seen_at=now, agent_name=agent.name)
+        )
+        if not batched:
+            # Otherwise issue one UPDATE for just the columns that change instead
+            # of flushing and re-reading the whole row.
+            await crud.update_where(
+                self.session,
+                Agent,
+                col(Agent.id) == agent.id,
+                updates=updates,
+            )
+        for field_name, value in updates.items():
+            set_committed_value(agent, field_name, value)
+        if not batched:
+            self.record_heartbeat(self.session, agent)
+            await self.session.commit()
         return self.to_agent_read(self.with_computed_status(agent))
 
     async def list_agents(
@@ -0,0 +1,118 @@
+# ruff: noqa: INP001
+"""Per-request memoization tests for agent token authentication."""
+
+from __future__ import annotations
+
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException, Request
+
+from app.core import agent_auth
+from app.core.time import utcnow
+from app.models.agents import Agent
+
+
+def _request(token: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/v1/agent/boards",
+            "headers": [(b"x-agent-token", token.encode())],
+        },
+    )
+
+
+def _patch_lookup(
+    monkeypatch: pytest.MonkeyPatch,
+    agent: Agent | None,
+) -> list[str]:
+    lookups: list[str] = []
+
+    async def _fake_find(_session: object, token: str) -> Agent | None:
+        lookups.append(token)
+        return agent
+
+    monkeypatch.setattr(agent_auth, "_find_agent_for_token", _fake_find)
+    return lookups
+
+
+@pytest.mark.asyncio
+async def test_required_and_optional_dependencies_share_one_lookup(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    agent = Agent(id=uuid4(), gateway_id=uuid4(), name="Worker", last_seen_at=utcnow())
+    lookups = _patch_lookup(monkeypatch, agent)
+    request = _request("token-a")
+    session: Any = object()
+
+    required = await agent_auth.get_agent_auth_context(
+        request,
+        agent_token="token-a",
+        authorization=None,
+        session=session,
+    )
+    optional = await agent_auth.get_agent_auth_context_optional(
+        request,
+        agent_token="token-a",
+        authorization=None,
+        session=session,
+    )
+
+    assert optional is required
+    assert required.agent is agent
+    assert lookups == ["token-a"]
+
+
+@pytest.mark.asyncio
+async def test_invalid_token_is_memoized_per_request(monkeypatch: pytest.MonkeyPatch) -> None:
+    lookups = _patch_lookup(monkeypatch, None)
+    request = _request("bad-token")
+    session: Any = object()
+
+    assert (
+        await agent_auth.get_agent_auth_context_optional(
+            request,
+            agent_token="bad-token",
+            authorization=None,
+            session=session,
+        )
+        is None
+    )
+    with pytest.raises(HTTPException) as exc_info:
+        await agent_auth.get_agent_auth_context(
+            request,
+            agent_token="bad-token",
+            authorization=None,
+            session=session,
+        )
+
+    assert exc_info.value.status_code == 401
+    assert lookups == ["bad-token"]
+
+
+@pytest.mark.asyncio
+async def test_memoized_context_is_not_reused_for_another_token(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    agent = Agent(id=uuid4(), gateway_id=uuid4(), name="Worker", last_seen_at=utcnow())
+    lookups = _patch_lookup(monkeypatch, agent)
+    request = _request("token-a")
+    session: Any = object()
+
+    await agent_auth.get_agent_auth_context(
+        request,
+        agent_token="token-a",
+        authorization=None,
+        session=session,
+    )
+    await agent_auth.get_agent_auth_context(
+        request,
+        agent_token=None,
+        authorization="Bearer token-b",
+        session=session,
+    )
+
+    assert lookups == ["token-a", "token-b"]
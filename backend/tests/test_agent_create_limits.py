@@ -11,6 +11,9 @@ import pytest
 from fastapi import HTTPException, status
 
 import app.services.openclaw.provisioning_db as agent_service
+from app.api import agent as agent_api
+from app.core.agent_auth import AgentAuthContext
+from app.models.agents import Agent
 from app.schemas.agents import AgentCreate
 
 
@@ -66,3 +69,39 @@ async def test_create_agent_as_lead_enforces_board_max_agents(
     assert exc_info.value.status_code == status.HTTP_409_CONFLICT
     assert "excluding the lead" in str(exc_info.value.detail)
     assert "max_agents=1" in str(exc_info.value.detail)
+
+
+@pytest.mark.asyncio
+async def test_lead_create_agent_forces_lead_board_and_keeps_payload_fields(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    lead_board_id = uuid4()
+    lead = Agent(
+        id=uuid4(),
+        board_id=lead_board_id,
+        gateway_id=uuid4(),
+        name="Lead",
+        is_board_lead=True,
+    )
+    payload = AgentCreate(
+        name="Worker Agent",
+        board_id=uuid4(),
+        identity_template="  identity  ",
+    )
+    captured: dict[str, AgentCreate] = {}
+
+    async def _fake_create_agent(*, payload: AgentCreate, **_kwargs: object) -> object:
+        captured["payload"] = payload
+        return object()
+
+    monkeypatch.setattr(agent_api.agents_api, "create_agent", _fake_create_agent)
+
+    await agent_api.create_agent(
+        payload=payload,
+        session=_FakeSession(),  # type: ignore[arg-type]
+        agent_ctx=AgentAuthContext(actor_type="agent", agent=lead),
+    )
+
+    forwarded = captured["payload"]
+    assert forwarded.board_id == lead_board_id
+    assert forwarded.model_dump(exclude={"board_id"}) == payload.model_dump(exclude={"board_id"})
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from uuid import UUID, uuid4
 
+import pytest
+
 from app.api import agent as agent_api
 from app.core.agent_auth import AgentAuthContext
 from app.models.agents import Agent
@@ -21,10 +23,11 @@ def _agent_ctx(*, board_id: UUID | None, status: str, is_board_lead: bool) -> Ag
     )
 
 
-def test_agent_healthz_returns_authenticated_agent_context() -> None:
+@pytest.mark.asyncio
+async def test_agent_healthz_returns_authenticated_agent_context() -> None:
     agent_ctx = _agent_ctx(board_id=uuid4(), status="online", is_board_lead=True)
 
-    response = agent_api.agent_healthz(agent_ctx=agent_ctx)
+    response = await agent_api.agent_healthz(agent_ctx=agent_ctx)
 
     assert response.ok is True
     assert response.agent_id == agent_ctx.agent.id
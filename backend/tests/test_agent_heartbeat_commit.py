@@ -0,0 +1,336 @@
+# ruff: noqa: INP001
+"""Heartbeat persistence tests for the agent lifecycle service."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import app.services.openclaw.provisioning_db as provisioning_db
+from app.core.time import utcnow
+from app.models.activity_events import ActivityEvent
+from app.models.agents import Agent
+from app.models.gateways import Gateway
+from app.models.organizations import Organization
+from app.services.openclaw.heartbeat_batcher import HeartbeatBatcher
+from app.services.openclaw.provisioning_db import AgentLifecycleService
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed_agents(session: AsyncSession, count: int, **fields: object) -> list[Agent]:
+    organization_id = uuid4()
+    gateway_id = uuid4()
+    session.add(Organization(id=organization_id, name=f"org-{organization_id}"))
+    await session.flush()
+    session.add(
+        Gateway(
+            id=gateway_id,
+            organization_id=organization_id,
+            name="gateway",
+            url="https://gateway.example.local",
+            workspace_root="/tmp/workspace",
+        ),
+    )
+    await session.flush()
+    agents = [
+        Agent(id=uuid4(), gateway_id=gateway_id, name=f"Worker {index}", **fields)
+        for index in range(count)
+    ]
+    session.add_all(agents)
+    await session.commit()
+    return agents
+
+
+def _record_statements(engine: AsyncEngine) -> list[str]:
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _record(_conn: object, _cursor: object, statement: str, *_args: object) -> None:
+        statements.append(" ".join(statement.split()))
+
+    return statements
+
+
+@pytest.mark.asyncio
+async def test_commit_heartbeat_updates_only_changed_columns() -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    statements = _record_statements(engine)
+
+    try:
+        async with session_maker() as session:
+            (agent,) = await _seed_agents(
+                session,
+                1,
+                status="provisioning",
+                wake_attempts=2,
+                checkin_deadline_at=utcnow() + timedelta(minutes=5),
+                last_seen_at=utcnow() - timedelta(minutes=1),
+            )
+            statements.clear()
+
+            read = await AgentLifecycleService(session).commit_heartbeat(
+                agent=agent,
+                status_value=None,
+            )
+
+        updates = [sql for sql in statements if sql.startswith("UPDATE agents")]
+        assert len(updates) == 1
+        assert "last_provision_error" not in updates[0]
+        assert "status=?" in updates[0]
+        assert not [sql for sql in statements if sql.startswith("SELECT")]
+        assert read.status == "online"
+
+        async with session_maker() as session:
+            stored = await session.get(Agent, agent.id)
+            assert stored is not None
+            assert stored.status == "online"
+            assert stored.wake_attempts == 0
+            assert stored.checkin_deadline_at is None
+            assert stored.last_seen_at == read.last_seen_at
+            events = (await session.exec(ActivityEvent.objects.all().statement)).all()
+            assert [event.event_type for event in events] == ["agent.heartbeat"]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_batcher_flushes_latest_heartbeat_per_agent_in_one_update() -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    statements = _record_statements(engine)
+    batcher = HeartbeatBatcher(session_maker)
+    now = utcnow()
+
+    try:
+        async with session_maker() as session:
+            first, second = await _seed_agents(session, 2, status="online")
+        assert batcher.enqueue(agent_id=first.id, seen_at=now, agent_name=first.name) is False
+
+        batcher.start(3600)
+        assert batcher.running
+        batcher.enqueue(agent_id=first.id, seen_at=now - timedelta(seconds=2), agent_name="a")
+        batcher.enqueue(agent_id=first.id, seen_at=now, agent_name=first.name)
+        batcher.enqueue(
+            agent_id=second.id,
+            seen_at=now - timedelta(seconds=1),
+            agent_name=second.name,
+        )
+        statements.clear()
+        await batcher.stop()
+
+        assert not batcher.running
+        assert len([sql for sql in statements if sql.startswith("UPDATE agents")]) == 1
+        async with session_maker() as session:
+            stored_first = await session.get(Agent, first.id)
+            stored_second = await session.get(Agent, second.id)
+            assert stored_first is not None
+            assert stored_second is not None
+            assert stored_first.last_seen_at == now
+            assert stored_second.last_seen_at == now - timedelta(seconds=1)
+            events = (await session.exec(ActivityEvent.objects.all().statement)).all()
+            assert sorted(event.message or "" for event in events) == [
+                f"Heartbeat received from {first.name}.",
+                f"Heartbeat received from {second.name}.",
+            ]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_commit_heartbeat_defers_presence_only_heartbeats_to_batcher(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    statements = _record_statements(engine)
+    batcher = HeartbeatBatcher(session_maker)
+    monkeypatch.setattr(provisioning_db, "heartbeat_batcher", batcher)
+
+    try:
+        async with session_maker() as session:
+            steady, waking = await _seed_agents(session, 2, status="online")
+            waking.wake_attempts = 1
+            session.add(waking)
+            await session.commit()
+            service = AgentLifecycleService(session)
+            batcher.start(3600)
+            statements.clear()
+
+            steady_read = await service.commit_heartbeat(agent=steady, status_value=None)
+            assert statements == []
+            assert steady_read.last_seen_at is not None
+
+            await service.commit_heartbeat(agent=waking, status_value=None)
+            assert len([sql for sql in statements if sql.startswith("UPDATE agents")]) == 1
+
+        await batcher.stop()
+        async with session_maker() as session:
+            stored = await session.get(Agent, steady.id)
+            assert stored is not None
+            assert stored.last_seen_at == steady_read.last_seen_at
+    finally:
+        await batcher.stop()
+        await engine.dispose()
+
+
+def _enable_sqlite_foreign_keys(engine: AsyncEngine) -> None:
+    @event.listens_for(engine.sync_engine, "connect")
+    def _pragma(dbapi_connection: Any, _record: object) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+@pytest.mark.asyncio
+async def test_batcher_skips_deleted_agents_without_losing_the_batch() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    _enable_sqlite_foreign_keys(engine)
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    batcher = HeartbeatBatcher(session_maker)
+    now = utcnow()
+
+    try:
+        async with session_maker() as session:
+            kept, deleted = await _seed_agents(session, 2, status="online")
+        batcher.start(3600)
+        for agent in (kept, deleted):
+            batcher.enqueue(agent_id=agent.id, seen_at=now, agent_name=agent.name)
+        async with session_maker() as session:
+            await session.delete(await session.get(Agent, deleted.id))
+            await session.commit()
+
+        await batcher.stop()
+
+        async with session_maker() as session:
+            stored = await session.get(Agent, kept.id)
+            assert stored is not None
+            assert stored.last_seen_at == now
+            events = (await session.exec(ActivityEvent.objects.all().statement)).all()
+            assert [event.agent_id for event in events] == [kept.id]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_queued_heartbeat_never_overwrites_a_newer_immediate_write(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    batcher = HeartbeatBatcher(session_maker)
+    monkeypatch.setattr(provisioning_db, "heartbeat_batcher", batcher)
+
+    try:
+        async with session_maker() as session:
+            (agent,) = await _seed_agents(session, 1, status="online")
+            service = AgentLifecycleService(session)
+            batcher.start(3600)
+
+            queued = await service.commit_heartbeat(agent=agent, status_value=None)
+            immediate = await service.commit_heartbeat(agent=agent, status_value="busy")
+            assert queued.last_seen_at is not None
+            assert immediate.last_seen_at is not None
+            assert immediate.last_seen_at > queued.last_seen_at
+
+        await batcher.stop()
+
+        async with session_maker() as session:
+            stored = await session.get(Agent, agent.id)
+            assert stored is not None
+            assert stored.status == "busy"
+            assert stored.last_seen_at == immediate.last_seen_at
+            assert stored.updated_at == immediate.last_seen_at
+    finally:
+        await batcher.stop()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_stop_waits_for_an_in_progress_flush() -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    flush_started = asyncio.Event()
+    release_flush = asyncio.Event()
+
+    @asynccontextmanager
+    async def _slow_session() -> AsyncIterator[AsyncSession]:
+        # Runs after the batch has been taken off the queue.
+        flush_started.set()
+        await release_flush.wait()
+        async with session_maker() as session:
+            yield session
+
+    batcher = HeartbeatBatcher(_slow_session)  # type: ignore[arg-type]
+    now = utcnow()
+
+    try:
+        async with session_maker() as session:
+            (agent,) = await _seed_agents(session, 1, status="online")
+        batcher.start(0.01)
+        batcher.enqueue(agent_id=agent.id, seen_at=now, agent_name=agent.name)
+        await flush_started.wait()
+
+        stopping = asyncio.create_task(batcher.stop())
+        await asyncio.sleep(0)
+        release_flush.set()
+        await stopping
+
+        async with session_maker() as session:
+            stored = await session.get(Agent, agent.id)
+            assert stored is not None
+            assert stored.last_seen_at == now
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_requeues_the_batch() -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    fail = True
+
+    @asynccontextmanager
+    async def _flaky_session() -> AsyncIterator[AsyncSession]:
+        if fail:
+            raise ConnectionError("database unavailable")
+        async with session_maker() as session:
+            yield session
+
+    batcher = HeartbeatBatcher(_flaky_session)  # type: ignore[arg-type]
+    now = utcnow()
+
+    try:
+        async with session_maker() as session:
+            (agent,) = await _seed_agents(session, 1, status="online")
+        batcher.start(3600)
+        batcher.enqueue(agent_id=agent.id, seen_at=now, agent_name=agent.name)
+
+        assert await batcher.flush() == 0
+        fail = False
+        await batcher.stop()
+
+        async with session_maker() as session:
+            stored = await session.get(Agent, agent.id)
+            assert stored is not None
+            assert stored.last_seen_at == now
+    finally:
+        await engine.dispose()
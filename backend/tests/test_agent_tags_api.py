@@ -74,9 +74,11 @@ async def test_list_tags_returns_tag_refs() -> None:
     )
 
     response = await agent_api.list_tags(
-        board=board,
+        board=await agent_api._guard_board_access(
+            board=board,
+            agent_ctx=_agent_ctx(board_id=board.id),
+        ),
         session=session,  # type: ignore[arg-type]
-        agent_ctx=_agent_ctx(board_id=board.id),
     )
 
     assert [tag.slug for tag in response] == ["backend", "urgent"]
@@ -87,12 +89,10 @@ async def test_list_tags_returns_tag_refs() -> None:
 @pytest.mark.asyncio
 async def test_list_tags_rejects_cross_board_agent() -> None:
     board = _board()
-    session = _FakeSession(tags=[])
 
     with pytest.raises(HTTPException) as exc:
-        await agent_api.list_tags(
+        await agent_api._guard_board_access(
             board=board,
-            session=session,  # type: ignore[arg-type]
             agent_ctx=_agent_ctx(board_id=uuid4()),
         )
 
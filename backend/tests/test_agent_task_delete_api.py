@@ -76,3 +76,29 @@ async def test_delete_task_allows_board_lead_and_calls_delete_helper(
     assert response.ok is True
     assert called["session"] is session
     assert called["task_id"] == task.id
+
+
+@pytest.mark.asyncio
+async def test_task_access_guard_rejects_cross_board_agent() -> None:
+    task = Task(
+        id=uuid4(),
+        board_id=uuid4(),
+        title="Other board task",
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        await agent_api._guard_task_access(
+            task=task,
+            agent_ctx=_agent_ctx(board_id=uuid4(), is_board_lead=True),
+        )
+
+    assert exc.value.status_code == 403
+
+
+def test_task_scope_ok_only_rejects_mismatched_board_ids() -> None:
+    board_id = uuid4()
+
+    assert agent_api._task_scope_ok(board_id, board_id) is True
+    assert agent_api._task_scope_ok(None, board_id) is True
+    assert agent_api._task_scope_ok(board_id, None) is True
+    assert agent_api._task_scope_ok(board_id, uuid4()) is False
@@ -0,0 +1,137 @@
+# ruff: noqa: INP001
+"""Request-scoped board loader batching tests."""
+
+from __future__ import annotations
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException, Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.deps import BoardLoader, get_board_loader, get_board_or_404
+from app.models.boards import Board
+from app.models.gateways import Gateway
+from app.models.organizations import Organization
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed_boards(session: AsyncSession, count: int) -> list[Board]:
+    organization_id = uuid4()
+    gateway_id = uuid4()
+    session.add(Organization(id=organization_id, name=f"org-{organization_id}"))
+    session.add(
+        Gateway(
+            id=gateway_id,
+            organization_id=organization_id,
+            name="gateway",
+            url="https://gateway.example.local",
+            workspace_root="/tmp/workspace",
+        ),
+    )
+    boards = [
+        Board(
+            id=uuid4(),
+            organization_id=organization_id,
+            gateway_id=gateway_id,
+            name=f"Board {index}",
+            slug=f"board-{index}",
+        )
+        for index in range(count)
+    ]
+    session.add_all(boards)
+    await session.commit()
+    return boards
+
+
+def _record_selects(engine: AsyncEngine) -> list[str]:
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _record(_conn: object, _cursor: object, statement: str, *_args: object) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    return statements
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_share_one_in_query() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            first, second = await _seed_boards(session, 2)
+            statements = _record_selects(engine)
+            loader = BoardLoader(session)
+
+            loaded = await asyncio.gather(
+                loader.load(first.id),
+                loader.load(second.id),
+                loader.load(uuid4()),
+            )
+            assert [board.id if board else None for board in loaded] == [
+                first.id,
+                second.id,
+                None,
+            ]
+            assert len(statements) == 1
+
+            assert await loader.load(first.id) is loaded[0]
+            assert await loader.load_many([second.id, first.id]) == [loaded[1], loaded[0]]
+            assert len(statements) == 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_missing_ids_are_memoized() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine) as session:
+            statements = _record_selects(engine)
+            loader = BoardLoader(session)
+            missing_id = uuid4()
+
+            assert await loader.load(missing_id) is None
+            assert await loader.load(missing_id) is None
+            assert len(statements) == 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_board_loader_is_cached_on_request_state() -> None:
+    request = Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+    session = AsyncSession()
+
+    loader = await get_board_loader(request, session)
+
+    assert request.state.board_loader is loader
+    assert await get_board_loader(request, session) is loader
+
+
+@pytest.mark.asyncio
+async def test_get_board_or_404_rejects_unknown_and_malformed_ids() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            (board,) = await _seed_boards(session, 1)
+            loader = BoardLoader(session)
+
+            assert (await get_board_or_404(str(board.id), loader)).id == board.id
+            for board_id in (str(uuid4()), "not-a-uuid"):
+                with pytest.raises(HTTPException) as exc_info:
+                    await get_board_or_404(board_id, loader)
+                assert exc_info.value.status_code == 404
+    finally:
+        await engine.dispose()
@@ -0,0 +1,186 @@
+# ruff: noqa: INP001
+"""Repeated-statement (N+1) guard middleware tests."""
+
+from __future__ import annotations
+
+import logging
+from uuid import uuid4
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi_pagination import add_pagination
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.agent import router as agent_router
+from app.core import response_cache
+from app.core.agent_auth import (
+    AgentAuthContext,
+    get_agent_auth_context,
+    get_agent_auth_context_optional,
+)
+from app.core.query_guard import QueryRepeatGuardMiddleware
+from app.db.session import get_session
+from app.models.agents import Agent
+from app.models.approvals import Approval
+from app.models.board_memory import BoardMemory
+from app.models.boards import Board
+from app.models.gateways import Gateway
+from app.models.organizations import Organization
+from app.models.tasks import Task
+
+_GUARD_LOGGER = "app.core.query_guard"
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+def _guarded_app(session_maker: async_sessionmaker[AsyncSession]) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(QueryRepeatGuardMiddleware, threshold=3)
+
+    async def _override_get_session() -> AsyncSession:
+        async with session_maker() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+    return app
+
+
+def _repeated_statements(caplog: pytest.LogCaptureFixture) -> list[str]:
+    return [
+        record.getMessage()
+        for record in caplog.records
+        if record.name == _GUARD_LOGGER and record.levelno == logging.WARNING
+    ]
+
+
+@pytest.mark.asyncio
+async def test_guard_warns_on_per_row_queries_only(caplog: pytest.LogCaptureFixture) -> None:
+    engine = await _make_engine()
+    app = _guarded_app(async_sessionmaker(engine, class_=AsyncSession))
+
+    @app.get("/loop")
+    async def _loop(session: AsyncSession = Depends(get_session)) -> int:
+        for value in range(3):
+            await session.exec(text("SELECT :value"), params={"value": value})  # type: ignore[call-overload]
+        return 3
+
+    @app.get("/batched")
+    async def _batched(session: AsyncSession = Depends(get_session)) -> int:
+        await session.exec(text("SELECT 1"))  # type: ignore[call-overload]
+        await session.exec(text("SELECT 2"))  # type: ignore[call-overload]
+        return 2
+
+    @app.get("/stream")
+    async def _stream(session: AsyncSession = Depends(get_session)) -> StreamingResponse:
+        for _ in range(3):
+            await session.exec(text("SELECT 1"))  # type: ignore[call-overload]
+        return StreamingResponse(iter([b"data: ok\n\n"]), media_type="text/event-stream")
+
+    caplog.set_level(logging.WARNING, logger=_GUARD_LOGGER)
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://testserver"
+        ) as client:
+            assert (await client.get("/batched")).status_code == 200
+            assert (await client.get("/stream")).status_code == 200
+            assert _repeated_statements(caplog) == []
+
+            assert (await client.get("/loop")).status_code == 200
+    finally:
+        await engine.dispose()
+
+    (message,) = _repeated_statements(caplog)
+    assert "path=/loop count=3" in message
+    assert "SELECT ?" in message
+
+
+async def _seed_board(session: AsyncSession, *, rows: int) -> tuple[Agent, Board]:
+    organization_id = uuid4()
+    gateway_id = uuid4()
+    session.add(Organization(id=organization_id, name=f"org-{organization_id}"))
+    session.add(
+        Gateway(
+            id=gateway_id,
+            organization_id=organization_id,
+            name="gateway",
+            url="https://gateway.example.local",
+            workspace_root="/tmp/workspace",
+        ),
+    )
+    board = Board(
+        id=uuid4(),
+        organization_id=organization_id,
+        gateway_id=gateway_id,
+        name="Board",
+        slug="board",
+    )
+    agent = Agent(id=uuid4(), board_id=board.id, gateway_id=gateway_id, name="Worker")
+    session.add_all([board, agent])
+    await session.flush()
+    for index in range(rows):
+        task = Task(
+            id=uuid4(), board_id=board.id, title=f"Task {index}", assigned_agent_id=agent.id
+        )
+        session.add(task)
+        await session.flush()
+        session.add(
+            Approval(
+                board_id=board.id,
+                task_id=task.id,
+                agent_id=agent.id,
+                action_type="deploy",
+                confidence=80,
+            ),
+        )
+        session.add(BoardMemory(board_id=board.id, content=f"note {index}", tags=["x"]))
+    await session.commit()
+    return agent, board
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("resource", ["tasks", "approvals", "memory"])
+async def test_agent_list_endpoints_issue_no_per_row_queries(
+    resource: str,
+    caplog: pytest.LogCaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_maker() as session:
+        agent, board = await _seed_board(session, rows=5)
+
+    app = _guarded_app(session_maker)
+    api_v1 = APIRouter(prefix="/api/v1")
+    api_v1.include_router(agent_router)
+    app.include_router(api_v1)
+    add_pagination(app)
+    app.dependency_overrides[get_agent_auth_context] = lambda: AgentAuthContext(
+        actor_type="agent", agent=agent
+    )
+    app.dependency_overrides[get_agent_auth_context_optional] = lambda: AgentAuthContext(
+        actor_type="agent", agent=agent
+    )
+    monkeypatch.setattr(response_cache, "_redis_client", lambda: None)
+
+    caplog.set_level(logging.WARNING, logger=_GUARD_LOGGER)
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://testserver"
+        ) as client:
+            response = await client.get(f"/api/v1/agent/boards/{board.id}/{resource}")
+    finally:
+        await engine.dispose()
+
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 5
+    assert _repeated_statements(caplog) == []
@@ -0,0 +1,165 @@
+# ruff: noqa: INP001
+"""Model manager query-building tests."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from sqlalchemy import ForeignKey, event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db import query_manager
+from app.db.query_manager import ModelManager
+from app.models.boards import Board
+from app.models.tasks import Task
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Owner(_Base):
+    __tablename__ = "qm_owners"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+
+
+class _Parent(_Base):
+    __tablename__ = "qm_parents"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    children: Mapped[list[_Child]] = relationship(back_populates="parent")
+
+
+class _Child(_Base):
+    __tablename__ = "qm_children"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    parent_id: Mapped[int] = mapped_column(ForeignKey("qm_parents.id"))
+    owner_id: Mapped[int] = mapped_column(ForeignKey("qm_owners.id"))
+    parent: Mapped[_Parent] = relationship(back_populates="children")
+    owner: Mapped[_Owner] = relationship()
+
+
+def _manager(model: type[Any]) -> ModelManager[Any]:
+    return ModelManager(model)
+
+
+async def _seeded_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(_Base.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        session.add(_Owner(id=1, name="owner"))
+        for parent_id in range(1, 4):
+            session.add(_Parent(id=parent_id))
+            session.add(_Child(id=parent_id * 10, parent_id=parent_id, owner_id=1))
+        await session.commit()
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_with_loads_eager_loads_dotted_relationships() -> None:
+    engine = await _seeded_engine()
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _record(_conn: object, _cursor: object, statement: str, *_args: object) -> None:
+        statements.append(statement)
+
+    try:
+        async with AsyncSession(engine) as session:
+            parents = await _manager(_Parent).with_loads("children.owner").all(session)
+            owner_names = [child.owner.name for parent in parents for child in parent.children]
+    finally:
+        await engine.dispose()
+
+    assert owner_names == ["owner", "owner", "owner"]
+    # One query per level of the path, independent of the number of parents.
+    assert len(statements) == 3
+
+
+def test_with_loads_rejects_non_relationship_attributes() -> None:
+    with pytest.raises(ValueError, match="is not a relationship"):
+        _manager(_Child).with_loads("owner_id")
+
+
+def test_all_without_loads_adds_no_loader_options() -> None:
+    assert _manager(_Parent).all().statement._with_options == ()
+
+
+def test_filter_by_combines_criteria_and_keeps_null_semantics() -> None:
+    statement = _manager(_Child).filter_by(parent_id=1, owner_id=None).statement
+    compiled = statement.compile(compile_kwargs={"literal_binds": True})
+
+    assert "qm_children.parent_id = 1 AND qm_children.owner_id IS NULL" in str(compiled)
+
+
+def test_filter_by_reuses_column_lookups_per_shape() -> None:
+    query_manager._filter_by_columns.cache_clear()
+
+    _manager(_Child).filter_by(parent_id=1, owner_id=2)
+    _manager(_Child).filter_by(parent_id=3, owner_id=4)
+    _manager(_Child).filter_by(owner_id=4)
+
+    info = query_manager._filter_by_columns.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
+def test_shared_base_statement_is_not_mutated_by_filters() -> None:
+    manager = _manager(_Parent)
+    manager.filter_by(id=1)
+    manager.with_loads("children")
+
+    assert manager.all().statement.whereclause is None
+    assert manager.all().statement._with_options == ()
+
+
+def test_by_field_in_specializes_empty_and_singleton_inputs() -> None:
+    manager = _manager(_Child)
+
+    def _sql(values: object) -> str:
+        statement = manager.by_field_in("parent_id", values).statement  # type: ignore[arg-type]
+        return str(statement.compile(compile_kwargs={"literal_binds": True}))
+
+    assert _sql([]).endswith("WHERE false")
+    assert "qm_children.parent_id = 7" in _sql({7})
+    assert "qm_children.parent_id IN (7, 8)" in _sql((7, 8))
+    assert "qm_children.parent_id IN (7, 8)" in _sql(value for value in (7, 8))
+    # `= NULL` would differ from `IN (NULL)`; a lone None keeps IN semantics.
+    assert "IN (NULL)" in _sql([None])
+
+
+@pytest.mark.asyncio
+async def test_get_uses_identity_map_before_querying() -> None:
+    engine = await _seeded_engine()
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _record(_conn: object, _cursor: object, statement: str, *_args: object) -> None:
+        statements.append(statement)
+
+    try:
+        async with AsyncSession(engine) as session:
+            first = await _manager(_Parent).get(session, 1)
+            again = await _manager(_Parent).get(session, 1)
+            missing = await _manager(_Parent).get(session, 99)
+    finally:
+        await engine.dispose()
+
+    assert first is not None
+    assert again is first
+    assert missing is None
+    assert len(statements) == 2
+
+
+def test_objects_descriptor_shares_one_manager_per_model() -> None:
+    assert Board.objects is Board.objects
+    assert Task.objects is Task.objects
+    assert Board.objects.model is Board
+    assert Task.objects.model is Task
+    assert Task(title="t").objects is Task.objects
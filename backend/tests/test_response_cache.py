@@ -0,0 +1,496 @@
+# ruff: noqa: INP001
+"""Response cache decorator and invalidation tests."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from app.api import boards as boards_api
+from app.core import response_cache
+from app.core.agent_auth import AgentAuthContext
+from app.models.agents import Agent
+from app.models.boards import Board
+from app.schemas.boards import BoardUpdate
+
+if TYPE_CHECKING:
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+class _ItemRead(BaseModel):
+    id: UUID
+    title: str
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self._redis = redis
+        self._ops: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    async def __aenter__(self) -> _FakePipeline:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        return None
+
+    def hset(self, key: str, *, mapping: dict[str, Any]) -> None:
+        self._ops.append(("hset", (key,), {"mapping": mapping}))
+
+    def expire(self, key: str, seconds: int) -> None:
+        self._ops.append(("expire", (key, seconds), {}))
+
+    def sadd(self, key: str, value: str) -> None:
+        self._ops.append(("sadd", (key, value), {}))
+
+    def hgetall(self, key: str) -> None:
+        self._ops.append(("hgetall", (key,), {}))
+
+    def get(self, key: str) -> None:
+        self._ops.append(("get", (key,), {}))
+
+    def incr(self, key: str) -> None:
+        self._ops.append(("incr", (key,), {}))
+
+    async def execute(self) -> list[Any]:
+        return [
+            await getattr(self._redis, name)(*args, **kwargs) for name, args, kwargs in self._ops
+        ]
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+        self.sets: dict[str, set[bytes]] = {}
+        self.locks: set[str] = set()
+        self.strings: dict[str, bytes] = {}
+
+    def pipeline(self, *, transaction: bool) -> _FakePipeline:
+        del transaction
+        return _FakePipeline(self)
+
+    async def hset(self, key: str, *, mapping: dict[str, Any]) -> None:
+        self.hashes[key] = {
+            name.encode(): value if isinstance(value, bytes) else str(value).encode()
+            for name, value in mapping.items()
+        }
+
+    async def hgetall(self, key: str) -> dict[bytes, bytes]:
+        return dict(self.hashes.get(key, {}))
+
+    async def expire(self, key: str, seconds: int) -> None:
+        del key, seconds
+
+    async def sadd(self, key: str, value: str) -> None:
+        self.sets.setdefault(key, set()).add(value.encode())
+
+    async def get(self, key: str) -> bytes | None:
+        return self.strings.get(key)
+
+    async def incr(self, key: str) -> int:
+        value = int(self.strings.get(key, b"0")) + 1
+        self.strings[key] = str(value).encode()
+        return value
+
+    async def smembers(self, key: str) -> set[bytes]:
+        return set(self.sets.get(key, set()))
+
+    async def set(self, key: str, value: bytes, *, nx: bool, ex: int) -> bool:
+        del value, nx, ex
+        if key in self.locks:
+            return False
+        self.locks.add(key)
+        return True
+
+    async def delete(self, *keys: str | bytes) -> None:
+        for raw in keys:
+            key = raw.decode() if isinstance(raw, bytes) else raw
+            self.hashes.pop(key, None)
+            self.sets.pop(key, None)
+            self.locks.discard(key)
+            self.strings.pop(key, None)
+
+
+def _request(board_id: UUID, *, query: bytes = b"limit=50") -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": f"/api/v1/agent/boards/{board_id}/tasks",
+            "query_string": query,
+            "headers": [],
+            "path_params": {"board_id": str(board_id)},
+            "route": SimpleNamespace(response_model=list[_ItemRead]),
+        },
+    )
+
+
+def _agent_ctx(board_id: UUID | None) -> AgentAuthContext:
+    return AgentAuthContext(
+        actor_type="agent",
+        agent=Agent(id=uuid4(), board_id=board_id, gateway_id=uuid4(), name="Worker"),
+    )
+
+
+def _counting_handler(calls: list[int]) -> Any:
+    @response_cache.cached_response(policy="short")
+    async def _list_items(
+        board_id: UUID,
+        agent_ctx: AgentAuthContext,
+        session: object = None,
+    ) -> list[_ItemRead]:
+        del agent_ctx, session
+        calls.append(1)
+        return [_ItemRead(id=board_id, title=f"call-{len(calls)}")]
+
+    return _list_items
+
+
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> _FakeRedis:
+    fake = _FakeRedis()
+    monkeypatch.setattr(response_cache, "_redis_client", lambda: fake)
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_cached_response_serves_repeat_requests_from_redis(fake_redis: _FakeRedis) -> None:
+    board_id = uuid4()
+    calls: list[int] = []
+    handler = _counting_handler(calls)
+    agent_ctx = _agent_ctx(board_id)
+
+    first = await handler(
+        board_id=board_id,
+        agent_ctx=agent_ctx,
+        _response_cache_request=_request(board_id),
+    )
+    second = await handler(
+        board_id=board_id,
+        agent_ctx=agent_ctx,
+        _response_cache_request=_request(board_id),
+    )
+
+    assert isinstance(first, Response)
+    assert isinstance(second, Response)
+    assert first.body == second.body
+    assert json.loads(second.body) == [{"id": str(board_id), "title": "call-1"}]
+    assert len(calls) == 1
+    assert fake_redis.sets[f"mc:response-cache:{board_id}:keys"]
+
+
+@pytest.mark.asyncio
+async def test_cached_response_keys_on_query_params(fake_redis: _FakeRedis) -> None:
+    board_id = uuid4()
+    calls: list[int] = []
+    handler = _counting_handler(calls)
+    agent_ctx = _agent_ctx(board_id)
+
+    await handler(
+        board_id=board_id,
+        agent_ctx=agent_ctx,
+        _response_cache_request=_request(board_id, query=b"limit=50"),
+    )
+    await handler(
+        board_id=board_id,
+        agent_ctx=agent_ctx,
+        _response_cache_request=_request(board_id, query=b"limit=10"),
+    )
+
+    assert len(calls) == 2
+    assert len(fake_redis.hashes) == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_board_responses_drops_board_entries(fake_redis: _FakeRedis) -> None:
+    board_id = uuid4()
+    calls: list[int] = []
+    handler = _counting_handler(calls)
+    agent_ctx = _agent_ctx(board_id)
+
+    await handler(
+        board_id=board_id,
+        agent_ctx=agent_ctx,
+        _response_cache_request=_request(board_id),
+    )
+    await response_cache.invalidate_board_responses(board_id)
+    response = await handler(
+        board_id=board_id,
+        agent_ctx=agent_ctx,
+        _response_cache_request=_request(board_id),
+    )
+
+    assert len(calls) == 2
+    assert isinstance(response, Response)
+    assert json.loads(response.body)[0]["title"] == "call-2"
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_while_refresh_runs(
+    fake_redis: _FakeRedis,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    board_id = uuid4()
+    calls: list[int] = []
+    handler = _counting_handler(calls)
+    agent_ctx = _agent_ctx(board_id)
+    await handler(
+        board_id=board_id,
+        agent_ctx=agent_ctx,
+        _response_cache_request=_request(board_id),
+    )
+    for entry in fake_redis.hashes.values():
+        entry[b"stale_at"] = b"0"
+
+    class _FakeSession:
+        async def __aenter__(self) -> _FakeSession:
+            return self
+
+        async def __aexit__(self, *_exc: object) -> None:
+            return None
+
+    monkeypatch.setattr(response_cache, "async_session_maker", _FakeSession)
+
+    stale = await handler(
+        board_id=board_id,
+        agent_ctx=agent_ctx,
+        _response_cache_request=_request(board_id),
+    )
+    for task in list(response_cache._background_refreshes):
+        await task
+
+    assert isinstance(stale, Response)
+    assert json.loads(stale.body)[0]["title"] == "call-1"
+    assert len(calls) == 2
+    (entry,) = fake_redis.hashes.values()
+    assert json.loads(entry[b"body"])[0]["title"] == "call-2"
+
+
+@pytest.mark.asyncio
+async def test_cached_response_is_passthrough_when_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(response_cache, "_redis_client", lambda: None)
+    board_id = uuid4()
+    calls: list[int] = []
+    handler = _counting_handler(calls)
+
+    response = await handler(
+        board_id=board_id,
+        agent_ctx=_agent_ctx(board_id),
+        _response_cache_request=_request(board_id),
+    )
+
+    assert response == [_ItemRead(id=board_id, title="call-1")]
+
+
+@pytest.mark.asyncio
+async def test_refresh_rebinds_session_bound_arguments(
+    fake_redis: _FakeRedis,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class _FakeSession:
+        async def __aenter__(self) -> _FakeSession:
+            return self
+
+        async def __aexit__(self, *_exc: object) -> None:
+            return None
+
+    class _Loader:
+        def __init__(self, session: object) -> None:
+            self.session = session
+
+        def with_session(self, session: object) -> _Loader:
+            return _Loader(session)
+
+    seen: list[object] = []
+
+    @response_cache.cached_response(policy="short")
+    async def _list_items(
+        board_id: UUID,
+        agent_ctx: AgentAuthContext,
+        loader: _Loader,
+        session: object = None,
+    ) -> list[_ItemRead]:
+        del agent_ctx
+        seen.append(loader.session)
+        return [_ItemRead(id=board_id, title="item")]
+
+    monkeypatch.setattr(response_cache, "async_session_maker", _FakeSession)
+    board_id = uuid4()
+    request_session = object()
+    kwargs: dict[str, Any] = {
+        "board_id": board_id,
+        "agent_ctx": _agent_ctx(board_id),
+        "loader": _Loader(request_session),
+        "session": request_session,
+    }
+    await _list_items(**kwargs, _response_cache_request=_request(board_id))
+    for entry in fake_redis.hashes.values():
+        entry[b"stale_at"] = b"0"
+    await _list_items(**kwargs, _response_cache_request=_request(board_id))
+    for task in list(response_cache._background_refreshes):
+        await task
+
+    assert seen[0] is request_session
+    assert isinstance(seen[1], _FakeSession)
+
+
+class _FakeRefreshSession:
+    async def __aenter__(self) -> _FakeRefreshSession:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        return None
+
+
+async def _drain_refreshes() -> None:
+    for task in list(response_cache._background_refreshes):
+        await task
+
+
+@pytest.mark.asyncio
+async def test_refresh_releases_its_lock_when_done(
+    fake_redis: _FakeRedis,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(response_cache, "async_session_maker", _FakeRefreshSession)
+    board_id = uuid4()
+    calls: list[int] = []
+    handler = _counting_handler(calls)
+    agent_ctx = _agent_ctx(board_id)
+
+    await handler(
+        board_id=board_id, agent_ctx=agent_ctx, _response_cache_request=_request(board_id)
+    )
+    for _ in range(2):
+        for entry in fake_redis.hashes.values():
+            entry[b"stale_at"] = b"0"
+        await handler(
+            board_id=board_id,
+            agent_ctx=agent_ctx,
+            _response_cache_request=_request(board_id),
+        )
+        await _drain_refreshes()
+
+    assert fake_redis.locks == set()
+    # One initial render plus one refresh per stale hit.
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_refresh_finishing_after_invalidation_is_not_served(
+    fake_redis: _FakeRedis,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(response_cache, "async_session_maker", _FakeRefreshSession)
+    board_id = uuid4()
+    agent_ctx = _agent_ctx(board_id)
+    titles = iter(["initial", "pre-write", "post-write"])
+    refresh_started = asyncio.Event()
+    release_refresh = asyncio.Event()
+
+    @response_cache.cached_response(policy="short")
+    async def _list_items(
+        board_id: UUID,
+        agent_ctx: AgentAuthContext,
+        session: object = None,
+    ) -> list[_ItemRead]:
+        del agent_ctx
+        title = next(titles)
+        if isinstance(session, _FakeRefreshSession):
+            # The refresh rendered its pre-write body; hold it until after the write.
+            refresh_started.set()
+            await release_refresh.wait()
+        return [_ItemRead(id=board_id, title=title)]
+
+    await _list_items(
+        board_id=board_id,
+        agent_ctx=agent_ctx,
+        session=object(),
+        _response_cache_request=_request(board_id),
+    )
+    for entry in fake_redis.hashes.values():
+        entry[b"stale_at"] = b"0"
+    await _list_items(
+        board_id=board_id,
+        agent_ctx=agent_ctx,
+        session=object(),
+        _response_cache_request=_request(board_id),
+    )
+    await refresh_started.wait()
+
+    await response_cache.invalidate_board_responses(board_id)
+    release_refresh.set()
+    await _drain_refreshes()
+
+    response = await _list_items(
+        board_id=board_id,
+        agent_ctx=agent_ctx,
+        session=object(),
+        _response_cache_request=_request(board_id),
+    )
+    assert isinstance(response, Response)
+    assert json.loads(response.body)[0]["title"] == "post-write"
+
+
+def _list_boards_request() -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/v1/agent/boards",
+            "query_string": b"limit=50",
+            "headers": [],
+            "path_params": {},
+            "route": SimpleNamespace(response_model=list[_ItemRead]),
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_board_update_drops_cached_board_lists_for_every_scope(
+    fake_redis: _FakeRedis,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    board = Board(id=uuid4(), organization_id=uuid4(), name="Board", slug="board")
+    calls: list[int] = []
+
+    @response_cache.cached_response(policy="normal")
+    async def _list_boards(agent_ctx: AgentAuthContext) -> list[_ItemRead]:
+        del agent_ctx
+        calls.append(1)
+        return [_ItemRead(id=board.id, title=f"call-{len(calls)}")]
+
+    async def _apply_board_update(**_kwargs: object) -> Board:
+        return board
+
+    monkeypatch.setattr(boards_api, "_apply_board_update", _apply_board_update)
+    agents = [_agent_ctx(board.id), _agent_ctx(None)]
+
+    for agent_ctx in agents:
+        await _list_boards(agent_ctx=agent_ctx, _response_cache_request=_list_boards_request())
+    assert fake_redis.sets[f"mc:response-cache:{board.id}:keys"]
+    assert fake_redis.sets["mc:response-cache:global:keys"]
+
+    await boards_api.update_board(
+        payload=BoardUpdate(),
+        session=cast("AsyncSession", object()),
+        board=board,
+    )
+    responses = [
+        await _list_boards(agent_ctx=agent_ctx, _response_cache_request=_list_boards_request())
+        for agent_ctx in agents
+    ]
+
+    assert len(calls) == 4
+    assert [json.loads(cast("Response", r).body)[0]["title"] for r in responses] == [
+        "call-3",
+        "call-4",
+    ]
@@ -5,9 +5,10 @@ from uuid import uuid4
 
 import pytest
 
-from app.api.tasks import _coerce_task_event_rows, _task_event_payload
+from app.api.tasks import _coerce_task_event_rows, _task_event_payload, _task_read
 from app.models.activity_events import ActivityEvent
 from app.models.tasks import Task
+from app.schemas.tasks import TaskRead
 
 
 @dataclass
@@ -115,3 +116,28 @@ def test_task_event_payload_includes_activity_for_non_comment_event() -> None:
     assert isinstance(task_payload, dict)
     assert task_payload["id"] == str(task.id)
     assert task_payload["is_blocked"] is False
+
+
+def test_task_read_matches_from_attributes_construction() -> None:
+    task = Task(
+        board_id=uuid4(),
+        title="Ship it",
+        description="Details",
+        status="review",
+        assigned_agent_id=uuid4(),
+    )
+    dependency_id = uuid4()
+    computed: dict[str, object] = {
+        "depends_on_task_ids": [dependency_id],
+        "tag_ids": [],
+        "tags": [],
+        "blocked_by_task_ids": [dependency_id],
+        "is_blocked": True,
+        "custom_field_values": {"points": 3},
+    }
+
+    expected = TaskRead.model_validate(task, from_attributes=True).model_copy(update=computed)
+    result = _task_read(task, **computed)
+
+    assert result == expected
+    assert result.model_dump(mode="json") == expected.model_dump(mode="json")
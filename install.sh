@@ -586,7 +586,7 @@ start_local_services() {
   info "Starting backend in background..."
   (
     cd "$REPO_ROOT/backend"
-    nohup uv run uvicorn app.main:app --host 0.0.0.0 --port "$backend_port" >"$LOG_DIR/backend.log" 2>&1 &
+    nohup uv run uvicorn app.main:app --host 0.0.0.0 --port "$backend_port" --timeout-keep-alive 120 >"$LOG_DIR/backend.log" 2>&1 &
     echo $! >"$LOG_DIR/backend.pid"
   )
 